@@ -15,10 +15,10 @@ from src.bible_models import (
 
 def time_operation(operation, *args, **kwargs):
     """Time an operation and return result and execution time in milliseconds."""
-    start_time = time.perf_counter()
+    start_time = time.perf_counter_ns()
     result = operation(*args, **kwargs)
-    end_time = time.perf_counter()
-    execution_time = (end_time - start_time) * 1000
+    end_time = time.perf_counter_ns()
+    execution_time = (end_time - start_time) / 1e6
     return result, execution_time
 
 
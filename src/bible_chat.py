@@ -3,6 +3,7 @@ from streamlit.components.v1 import html
 from openai import OpenAI
 import os
 import re
+import time
 import json
 import glob
 from pathlib import Path
@@ -10,13 +11,16 @@ from datetime import datetime, timedelta
 from dotenv import load_dotenv
 from typing import Dict, List, Optional
 from bible_models import BiblePassage, BibleVerse
-from bible_format import clean_verse_text
+from bible_format import clean_verse_text, is_psalm_119, pause_marker, psalm119_active_verses
 from bible_speak import refresh_speak_html
 from s3_bible_cache import S3BibleCache
 
 # Load environment variables
 load_dotenv()
 
+# Single strftime call for the page title; Windows spells "no leading zero" as %#d
+DATE_TITLE_FORMAT = "%A %#d %B %Y" if os.name == "nt" else "%A %-d %B %Y"
+
 class McCheyneReader:
     """M'Cheyne reading system integration for Streamlit with S3 support"""
     
@@ -62,6 +66,10 @@ class McCheyneReader:
         return self.cache.get_all_passages(readings)
 
 class BibleChat:
+    # Seconds of deltas to coalesce per yield; keeps st.write_stream from
+    # re-rendering on every token of a fast model
+    STREAM_FLUSH_INTERVAL = 0.05
+
     def __init__(self):
         self.client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
         self.system_prompt = """You are a Bible-focused assistant specializing in the New King James Version (NKJV). 
@@ -99,10 +107,19 @@ Guidelines:
                 reasoning={"effort": "low"}, # Set the reasoning effort (minimal, low, medium, or high)
                 stream=True,
             )
+            buffer = []
+            last_flush = time.perf_counter()
             for event in stream:
-                # Yield only the text delta events; ignore others like created/done
+                # Buffer only the text delta events; ignore others like created/done
                 if event.type == "response.output_text.delta":
-                    yield event.delta
+                    buffer.append(event.delta)
+                    now = time.perf_counter()
+                    if now - last_flush > self.STREAM_FLUSH_INTERVAL:
+                        yield "".join(buffer)
+                        buffer.clear()
+                        last_flush = now
+            if buffer:
+                yield "".join(buffer)
         except Exception as e:
             yield f"Error generating response: {str(e)}"
 
@@ -175,6 +192,14 @@ def display_bible_passage(passage: BiblePassage, passage_index: int):
     chapters = group_verses_by_chapter(passage.verses)
     chapter_numbers = sorted(chapters.keys())
     
+    # The audio text only changes with the date or passage, so reruns that merely
+    # redraw the page (e.g. a mode toggle) reuse the previous full_text/speak_html.
+    # Keyed on the resolved date: selected_day is relative to today.
+    ss = st.session_state
+    target_date = (datetime.now() + timedelta(days=ss.selected_day)).date()
+    audio_key = (target_date, passage_index, passage.reference)
+    build_audio = ss.get('_last_audio_key') != audio_key or 'speak_html' not in ss
+    
     audio_text = ""
     # Display each chapter separately
     for i, chapter_num in enumerate(chapter_numbers):
@@ -192,36 +217,47 @@ def display_bible_passage(passage: BiblePassage, passage_index: int):
             st.markdown('<div class="chapter-separator"></div>', unsafe_allow_html=True)
             st.markdown(f"## {book_name} {chapter_num}")
         
-        if "psalm" in book_name.lower():
-            say_chapter = ""
-        else:
-            say_chapter = "chapter "
-        audio_text += f"{book_name} {say_chapter} {chapter_num}\n"
-        audio_text += "{{pause 3}}"
+        if build_audio:
+            if "psalm" in book_name.lower():
+                say_chapter = ""
+            else:
+                say_chapter = "chapter "
+            audio_text += f"{book_name} {say_chapter} {chapter_num}\n"
+            audio_text += pause_marker(3)
+
+        # Psalm 119 is read in daily portions, so leave out the other verses
+        if is_psalm_119(chapter_num, book_name):
+            active_verses = psalm119_active_verses(st.session_state.selected_day)
+            if not active_verses:
+                st.info("Psalm 119 has no portion scheduled for this day in the M'Cheyne plan.")
+            chapter_verses = [verse for verse in chapter_verses if verse.verse in active_verses]
 
         # Display all verses in this chapter
         for verse in chapter_verses:
+            if build_audio:
+                if verse.text[-1] == ",":
+                    verse_pause = ""
+                else: 
+                    verse_pause = pause_marker(1)
+                audio_text_to_add = clean_verse_text(verse.text, verse.verse, chapter_num, book_name, st.session_state.selected_day, text_only=True)
+                if audio_text_to_add:
+                    audio_text += audio_text_to_add + verse_pause
             # Use HTML for better typography control
-            if verse.text[-1] == ",":
-                verse_pause = ""
-            else: 
-                verse_pause = "{{pause 1}}"
-            audio_text_to_add = clean_verse_text(verse.text, verse.verse, chapter_num, book_name, st.session_state.selected_day, True) 
-            if audio_text_to_add:
-                audio_text += audio_text_to_add + verse_pause
             verse_html = clean_verse_text(verse.text, verse.verse, chapter_num, book_name, st.session_state.selected_day)
             if not (verse_html == "<span></span>"):
                 st.html(verse_html)
     
-    st.session_state.full_text = audio_text.replace("Lᴏʀᴅ", "Lord")
-    refresh_speak_html()
+    if build_audio:
+        st.session_state.full_text = audio_text
+        refresh_speak_html()
+        ss._last_audio_key = audio_key
 
     # Highlights section (if any exist) - minimal display
     if passage.highlights:
         st.markdown("---")
         st.markdown("### ✨ Popular Highlights")
         
-        popular_highlights = passage.get_popular_highlights()[:3]  # Show top 3 only
+        popular_highlights = passage.get_popular_highlights(limit=3)  # Show top 3 only
         for i, highlight in enumerate(popular_highlights, 1):
             try:
                 highlighted_text = highlight.get_highlighted_text(passage)
@@ -542,18 +578,15 @@ def main():
     
     # Calculate the target date based on selected day
     target_date = datetime.now() + timedelta(days=st.session_state.selected_day)
-    day_name = target_date.strftime("%A")
-    day_num = target_date.day
-    month_name = target_date.strftime("%B")
-    year = target_date.year
+    date_str = target_date.strftime(DATE_TITLE_FORMAT)  # e.g. "Monday 9 September 2025"
     
     # Dynamic title based on selected day
-    if st.session_state.selected_day == -1:
-        date_title = f"🗓️ Yesterday was {day_name} {day_num} {month_name} 2025."
-    elif st.session_state.selected_day == 0:
-        date_title = f"🗓️ Today is {day_name} {day_num} {month_name} 2025."
-    else:  # tomorrow
-        date_title = f"🗓️ Tomorrow will be {day_name} {day_num} {month_name} 2025."
+    date_titles = {
+        -1: f"🗓️ Yesterday was {date_str}.",
+        0: f"🗓️ Today is {date_str}.",
+        1: f"🗓️ Tomorrow will be {date_str}.",
+    }
+    date_title = date_titles[st.session_state.selected_day]
     
     st.markdown(f"# {date_title}", unsafe_allow_html=True)
     
@@ -578,25 +611,16 @@ def main():
         
         st.page_link("pages/about_.py", label="*First time here?*")
 
-        refresh_speak_html()
-        html(st.session_state.speak_html, height=80)
+        # Reserve the player's slot above the passage and fill it once the passage
+        # has built this run's full_text, so the first load needs no extra rerun
+        speak_player = st.empty()
 
         display_reading_mode()
-        
-        # Detect changes (initial load or switch) and force one rerun after update
-        needs_rerun = False
-        if 'last_day' not in st.session_state or 'last_index' not in st.session_state:
-            needs_rerun = True  # Initial load
-        elif (st.session_state.last_day != st.session_state.selected_day or
-              st.session_state.last_index != st.session_state.selected_passage_index):
-            needs_rerun = True  # Switch detected
-
-        # Update trackers
-        st.session_state.last_day = st.session_state.selected_day
-        st.session_state.last_index = st.session_state.selected_passage_index
-
-        if needs_rerun:
-            st.rerun()
+
+        if 'speak_html' not in st.session_state:
+            refresh_speak_html()
+        with speak_player:
+            html(st.session_state.speak_html, height=80)
 
     else:  # Chat mode
         st.markdown("*Ask questions and receive answers grounded in Scripture (NKJV)*")
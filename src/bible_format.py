@@ -1,104 +1,160 @@
 import re
-from datetime import datetime, timedelta
+from datetime import date, timedelta
+from functools import lru_cache
+from typing import Optional
+
+# Audio pauses are written as PAUSE_MARK + seconds + PAUSE_MARK so that
+# bible_speak can pull them apart with a single str.split.
+PAUSE_MARK = "\x01"
+
+def pause_marker(seconds: int) -> str:
+    return f"{PAUSE_MARK}{seconds}{PAUSE_MARK}"
+
+# Pattern to match a space followed by [single letter]
+_FOOTNOTE_RE = re.compile(r'\s\[[a-zA-Z]\]')
+# Pattern to match two quotation marks separated by a single space
+_QUOTE_RE = re.compile(r'[“”‘’][ ][“”‘’]')
+_QUOTE_MAP = {'“': '”', '‘': '’', '”': '”', '’': '’'}
+
+def _convert_quotes(match: re.Match) -> str:
+    first_quote = _QUOTE_MAP[match.group(0)[0]]  # Convert first quote to closing
+    second_quote = _QUOTE_MAP[match.group(0)[2]] # Convert second quote to closing
+    return first_quote + second_quote
+
+# Footnote markers and spurious quote pairs, matched in a single pass
+_CLEAN_RE = re.compile(r'\s\[[a-zA-Z]\]|([“”‘’]) ([“”‘’])')
+
+def _clean_match(match: re.Match) -> str:
+    if match.group(1) is None:
+        return ''  # Footnote marker
+    return _QUOTE_MAP[match.group(1)] + _QUOTE_MAP[match.group(2)]
+
+def _has_curly_quotes(text: str) -> bool:
+    return '“' in text or '”' in text or '‘' in text or '’' in text
 
 def remove_footnotes(text: str) -> str:
     """
     Removes footnotes in the format [a], [b], etc., along with a single space before them.
     """
-    # Pattern to match a space followed by [single letter]
-    pattern = r'\s\[[a-zA-Z]\]'
-    # Replace with empty string
-    return re.sub(pattern, '', text)
+    if '[' not in text:
+        return text
+    return _FOOTNOTE_RE.sub('', text)
 
 def correct_quotations(text: str) -> str:
     """
     Corrects spurious quotation marks.
     """
-    pattern = r'[“”‘’][ ][“”‘’]'
-    def convert_quotes(match):
-        quote_map = {'“': '”', '‘': '’', '”': '”', '’': '’'}
-        first_quote = quote_map[match.group(0)[0]]  # Convert first quote to closing
-        second_quote = quote_map[match.group(0)[2]] # Convert second quote to closing
-        return first_quote + second_quote
-    return re.sub(pattern, convert_quotes, text)
+    if not _has_curly_quotes(text):
+        return text
+    return _QUOTE_RE.sub(_convert_quotes, text)
+
+def clean_markup(text: str) -> str:
+    """
+    Removes footnotes and corrects spurious quotation marks in one regex.
+    The second pass picks up quote runs left behind by the first.
+    """
+    if '[' not in text and not _has_curly_quotes(text):
+        return text
+    text = _CLEAN_RE.sub(_clean_match, text)
+    if not _has_curly_quotes(text):
+        return text
+    return _CLEAN_RE.sub(_clean_match, text)
 
 
 def is_psalm_119(chapter: int, book: str) -> bool:
-    return (chapter == 119) and ("psalm" in book.lower())
-
-def is_in_todays_psalm_119_range(verse: int, day_offset: int) -> bool:
-    MCHEYNE_119 = {
-        "June 22": [i for i in range(1,25)],
-        "June 23": [i for i in range(25,49)],
-        "June 24": [i for i in range(49,73)],
-        "June 25": [i for i in range(73,97)],
-        "June 26": [i for i in range(97,121)],
-        "June 27": [i for i in range(121,145)],
-        "June 28": [i for i in range(145,177)],
-        "October 25": [i for i in range(1,25)],
-        "October 26": [i for i in range(25,49)],
-        "October 27": [i for i in range(49,73)],
-        "October 28": [i for i in range(73,97)],
-        "October 29": [i for i in range(97,121)],
-        "October 30": [i for i in range(121,145)],
-        "October 31": [i for i in range(145,177)],
-        }
-    target_date = datetime.now() + timedelta(days=day_offset)
-    day_num = target_date.day
-    month_name = target_date.strftime("%B")
-    month_day = f"{month_name} {day_num}"
-    verse_range = MCHEYNE_119[month_day]
-    return verse in verse_range
-
-def render_psalm_119(text: str, verse: int, day_offset: int, text_only: bool) -> str:
-    HEBREW_ALEPHS = [
-        "א", "ב", "ג",
-        "ד", "ה", "ו",
-        "ז", "ח", "ט",
-        "י", "כ", "ל",
-        "מ", "נ", "ס",
-        "ע", "פ", "צ",
-        "ק", "ר", "ש", "ת"
-        ]
-    HEBREW_ENGS = [
-        "Aleph", "Beth", "Gimel",
-        "Daleth", "He", "Waw",
-        "Zayin", "Heth", "Teth",
-        "Yod", "Kaph", "Lamed",
-        "Mem", "Nun", "Samek",
-        "Ayin", "Pe", "Tsade",
-        "Qoph", "Resh", "Shin", "Tau"
-        ]
-    
-    if is_in_todays_psalm_119_range(verse, day_offset):
-    
-        preamble = ""
-        audio_preamble = ""
-
-        if verse % 8 == 1:
-            hebrew_aleph = HEBREW_ALEPHS[int(verse/8.01)]
-            hebrew_eng = HEBREW_ENGS[int(verse/8.01)]
-            preamble = f"""
-            <div class="chapter-separator">
-                <span class="small-caps">{hebrew_aleph} {hebrew_eng}</span>
-            </div>
-            """
-            audio_preamble = hebrew_eng + "{{pause 2}}"
-        verse_html = f"""{preamble}
-                <div class="bible-text">
-                    <span class="verse-number">{verse}.</span>{text}
-                </div>
-                """
-        
+    return chapter == 119 and "psalm" in book.lower()
+
+# Psalm 119 verses read on each day of the M'Cheyne plan
+_MCHEYNE_119 = {
+    "June 22": frozenset(range(1,25)),
+    "June 23": frozenset(range(25,49)),
+    "June 24": frozenset(range(49,73)),
+    "June 25": frozenset(range(73,97)),
+    "June 26": frozenset(range(97,121)),
+    "June 27": frozenset(range(121,145)),
+    "June 28": frozenset(range(145,177)),
+    "October 25": frozenset(range(1,25)),
+    "October 26": frozenset(range(25,49)),
+    "October 27": frozenset(range(49,73)),
+    "October 28": frozenset(range(73,97)),
+    "October 29": frozenset(range(97,121)),
+    "October 30": frozenset(range(121,145)),
+    "October 31": frozenset(range(145,177)),
+    }
+
+_MONTHS = (
+    "January", "February", "March", "April", "May", "June",
+    "July", "August", "September", "October", "November", "December"
+    )
+
+@lru_cache(maxsize=8)
+def _active_119_range(target_date: date) -> frozenset:
+    """
+    Psalm 119 verses read on target_date (empty on days outside the plan).
+    Keyed on the date rather than the day offset so it never goes stale.
+    """
+    month_day = f"{_MONTHS[target_date.month - 1]} {target_date.day}"
+    return _MCHEYNE_119.get(month_day, frozenset())
+
+def psalm119_active_verses(day_offset: int, today: Optional[date] = None) -> frozenset:
+    """
+    Psalm 119 verses scheduled for the given day, so callers can skip the rest.
+    """
+    if today is None:
+        today = date.today()
+    return _active_119_range(today + timedelta(days=day_offset))
+
+def is_in_todays_psalm_119_range(verse: int, day_offset: int, today: Optional[date] = None) -> bool:
+    return verse in psalm119_active_verses(day_offset, today)
+
+_EMPTY = ""
+_EMPTY_SPAN = "<span></span>"
+_VERSE_HTML = '<div class="bible-text"><span class="verse-number">{v}.</span>{t}</div>'
+
+# Psalm 119 is an acrostic: one Hebrew letter heads each 8-verse section
+_HEBREW_ALEPHS = (
+    "א", "ב", "ג",
+    "ד", "ה", "ו",
+    "ז", "ח", "ט",
+    "י", "כ", "ל",
+    "מ", "נ", "ס",
+    "ע", "פ", "צ",
+    "ק", "ר", "ש", "ת"
+    )
+_HEBREW_ENGS = (
+    "Aleph", "Beth", "Gimel",
+    "Daleth", "He", "Waw",
+    "Zayin", "Heth", "Teth",
+    "Yod", "Kaph", "Lamed",
+    "Mem", "Nun", "Samek",
+    "Ayin", "Pe", "Tsade",
+    "Qoph", "Resh", "Shin", "Tau"
+    )
+_HEBREW_HEADERS = tuple(zip(_HEBREW_ALEPHS, _HEBREW_ENGS))
+_PSALM119_PREAMBLES = tuple(
+    f'<div class="chapter-separator"><span class="small-caps">{hebrew_aleph} {hebrew_eng}</span></div>'
+    for hebrew_aleph, hebrew_eng in _HEBREW_HEADERS
+    )
+_PSALM119_AUDIO_PREAMBLES = tuple(hebrew_eng + pause_marker(2) for hebrew_eng in _HEBREW_ENGS)
+
+def render_psalm_119(text: str, verse: int, day_offset: int, text_only: bool, today: Optional[date] = None) -> str:
+    if is_in_todays_psalm_119_range(verse, day_offset, today):
+        section_start = verse % 8 == 1
+
         if text_only:
-            return audio_preamble + text
-        else: 
-            return verse_html
+            if section_start:
+                return _PSALM119_AUDIO_PREAMBLES[(verse - 1) // 8] + text
+            return text
+
+        verse_html = _VERSE_HTML.format(v=verse, t=text)
+        if section_start:
+            return _PSALM119_PREAMBLES[(verse - 1) // 8] + verse_html
+        return verse_html
     else:
         if text_only:
-            return ""
+            return _EMPTY
         else:
-            return "<span></span>"
+            return _EMPTY_SPAN
 
 
 def clean_verse_text(
@@ -106,28 +162,34 @@ def clean_verse_text(
         verse: int, 
         chapter: int, 
         book: str, 
-        day_offset: int,
+        day_offset: int = 0,
         text_only: bool = False
         ) -> str:
-    text = remove_footnotes(text)
-    text = correct_quotations(text)
-    text = correct_quotations(text)
+    """
+    Cleans a verse and renders it as HTML, or as plain text for audio.
+    Results are memoised; today's date is part of the key because the
+    Psalm 119 output depends on it.
+    """
+    return _clean_verse_text(text, verse, chapter, book, day_offset, text_only, date.today())
+
+@lru_cache(maxsize=4096)
+def _clean_verse_text(
+        text: str, 
+        verse: int, 
+        chapter: int, 
+        book: str, 
+        day_offset: int,
+        text_only: bool,
+        today: date
+        ) -> str:
+    text = clean_markup(text)
+    if text_only and "Lᴏʀᴅ" in text:
+        # Speech engines spell out small-caps letters, so read the divine name as "Lord"
+        text = text.replace("Lᴏʀᴅ", "Lord")
 
     if is_psalm_119(chapter, book):
-        return render_psalm_119(text, verse, day_offset, text_only)
+        return render_psalm_119(text, verse, day_offset, text_only, today)
 
-    verse_html = f"""
-            <div class="bible-text">
-                <span class="verse-number">{verse}.</span>{text}
-            </div>
-            """
     if text_only:
         return text
-    else:
-        return verse_html
-
-if __name__ == "__main__":
-    for i in range (19):
-        j = i + 1
-        print(j, int(j/8.01))
-    print("א")
\ No newline at end of file
+    return _VERSE_HTML.format(v=verse, t=text)
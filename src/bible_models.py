@@ -5,15 +5,25 @@ This module provides structured data models for Bible passages, verses, and user
 with comprehensive validation and metadata support.
 """
 
-from pydantic import BaseModel, Field, field_validator, model_validator
-from typing import List, Any, Dict, TYPE_CHECKING, Optional
+from pydantic import AfterValidator, BaseModel, ConfigDict, Field, field_validator, model_validator
+from typing import List, Any, Dict, Set, TYPE_CHECKING, Optional
+from typing_extensions import Annotated  # typing.Annotated needs Python 3.9
 from datetime import datetime
+from dataclasses import dataclass
 import json
+import sys
 import functools
+import heapq
+import itertools
+from functools import cached_property
 import time
-import psutil
-import os
 from threading import Lock
+from collections import Counter, OrderedDict, deque
+
+try:
+    import orjson  # Optional: faster JSON encoding for the small leaf models
+except ImportError:
+    orjson = None
 
 if TYPE_CHECKING:
     pass  # BiblePassage will be defined later in this file
@@ -23,10 +33,14 @@ if TYPE_CHECKING:
 class PerformanceMonitor:
     """Utility class for monitoring performance and memory usage."""
     
+    __slots__ = ()  # Used only as a namespace of static methods
+    
     @staticmethod
     def get_memory_usage() -> Dict[str, float]:
         """Get current memory usage statistics."""
-        process = psutil.Process(os.getpid())
+        import psutil  # Imported on first use to keep it off the app's import path
+        
+        process = psutil.Process()
         memory_info = process.memory_info()
         return {
             'rss_mb': memory_info.rss / 1024 / 1024,  # Resident Set Size in MB
@@ -34,41 +48,130 @@ class PerformanceMonitor:
             'percent': process.memory_percent()
         }
     
+    # Time one call in every _SAMPLE_N per decorated function
+    _SAMPLE_N = 64
+    # Recent (function name, milliseconds) pairs for calls slower than 100ms
+    _slow_calls: deque = deque(maxlen=256)
+    
     @staticmethod
     def time_function(func):
-        """Decorator to time function execution."""
+        """
+        Decorator to time function execution.
+        
+        Only a sample of calls is timed, and slow calls are recorded in memory
+        rather than printed; read them with drain_slow_calls().
+        """
+        counter = itertools.count()
+        sample_n = PerformanceMonitor._SAMPLE_N
+        slow_calls = PerformanceMonitor._slow_calls
+        
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
+            if next(counter) % sample_n:
+                return func(*args, **kwargs)
+            
             start_time = time.perf_counter()
             result = func(*args, **kwargs)
             end_time = time.perf_counter()
             execution_time = (end_time - start_time) * 1000  # Convert to milliseconds
             
-            # Log if execution takes longer than 100ms
+            # Record if execution takes longer than 100ms
             if execution_time > 100:
-                print(f"Performance warning: {func.__name__} took {execution_time:.2f}ms")
+                slow_calls.append((func.__name__, execution_time))
             
             return result
         return wrapper
+    
+    @staticmethod
+    def drain_slow_calls() -> List[tuple]:
+        """
+        Return and clear the recorded slow calls.
+        
+        Returns:
+            List of (function name, execution time in ms) tuples, oldest first
+        """
+        slow_calls = PerformanceMonitor._slow_calls
+        drained = []
+        while slow_calls:
+            drained.append(slow_calls.popleft())
+        return drained
 
 
 # Caching decorators and utilities
+_MISSING = object()
+
+
 class CacheManager:
-    """Thread-safe cache manager for expensive computations."""
+    """
+    Thread-safe cache manager for expensive computations.
+    
+    Holds at most maxsize entries, evicting the least recently used. Reads
+    go straight to the OrderedDict (its C methods are atomic in CPython);
+    writes take the global lock. get_or_compute adds a per-key lock so that
+    concurrent misses on the same key compute it once while other keys proceed.
+    """
+    
+    __slots__ = ('maxsize', '_cache', '_lock', '_key_locks', '_key_locks_lock')
     
-    def __init__(self):
-        self._cache = {}
+    def __init__(self, maxsize: int = 1024):
+        self.maxsize = maxsize
+        self._cache: OrderedDict = OrderedDict()
         self._lock = Lock()
+        self._key_locks: Dict[str, Lock] = {}
+        self._key_locks_lock = Lock()
+    
+    def _lookup(self, key: str) -> Any:
+        """Return the cached value (or _MISSING) and mark it recently used."""
+        value = self._cache.get(key, _MISSING)
+        if value is not _MISSING:
+            try:
+                self._cache.move_to_end(key)
+            except KeyError:
+                pass  # Evicted by another thread since the read
+        return value
+    
+    def _store(self, key: str, value: Any) -> None:
+        """Insert a value and evict the oldest entries beyond maxsize."""
+        with self._lock:
+            self._cache[key] = value
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.maxsize:
+                self._cache.popitem(last=False)
     
     def get(self, key: str) -> Any:
         """Get value from cache."""
-        with self._lock:
-            return self._cache.get(key)
+        value = self._lookup(key)
+        return None if value is _MISSING else value
     
     def set(self, key: str, value: Any) -> None:
         """Set value in cache."""
-        with self._lock:
-            self._cache[key] = value
+        self._store(key, value)
+    
+    def get_or_compute(self, key: str, factory) -> Any:
+        """
+        Get value from cache, computing and storing it with factory() on a miss.
+        
+        Only one thread computes a given key; others missing on the same key
+        wait for it and then read the stored value.
+        """
+        value = self._lookup(key)
+        if value is not _MISSING:
+            return value
+        
+        with self._key_locks_lock:
+            key_lock = self._key_locks.setdefault(key, Lock())
+        
+        try:
+            with key_lock:
+                # Double-check: another thread may have filled it while we waited
+                value = self._cache.get(key, _MISSING)
+                if value is _MISSING:
+                    value = factory()
+                    self._store(key, value)
+        finally:
+            with self._key_locks_lock:
+                self._key_locks.pop(key, None)
+        return value
     
     def clear(self) -> None:
         """Clear all cached values."""
@@ -77,37 +180,13 @@ class CacheManager:
     
     def size(self) -> int:
         """Get number of cached items."""
-        with self._lock:
-            return len(self._cache)
+        return len(self._cache)
 
 
 # Global cache instance
 _global_cache = CacheManager()
 
 
-def cached_property(func):
-    """
-    Decorator for caching expensive property computations.
-    
-    This decorator caches the result of a property computation on the instance
-    to avoid recalculating expensive operations like word counts and statistics.
-    """
-    cache_attr = f'_cached_{func.__name__}'
-    
-    @functools.wraps(func)
-    def wrapper(self):
-        # Check if we have a cached value
-        if hasattr(self, cache_attr):
-            return getattr(self, cache_attr)
-        
-        # Compute and cache the value
-        result = func(self)
-        setattr(self, cache_attr, result)
-        return result
-    
-    return property(wrapper)
-
-
 def lazy_property(func):
     """
     Decorator for lazy loading of expensive properties.
@@ -118,9 +197,10 @@ def lazy_property(func):
     
     @functools.wraps(func)
     def wrapper(self):
-        # Check if we have a cached value
-        if hasattr(self, cache_attr):
-            return getattr(self, cache_attr)
+        # Check if we have a cached value (one dict probe, no descriptor lookup)
+        cached = self.__dict__.get(cache_attr, _MISSING)
+        if cached is not _MISSING:
+            return cached
         
         # Monitor performance for expensive operations
         start_time = time.perf_counter()
@@ -132,12 +212,23 @@ def lazy_property(func):
             print(f"Lazy property {func.__name__} computed in {execution_time:.2f}ms")
         
         # Cache the result
-        setattr(self, cache_attr, result)
+        self.__dict__[cache_attr] = result
         return result
     
     return property(wrapper)
 
 
+@functools.lru_cache(maxsize=None)
+def _cached_property_names(cls) -> tuple:
+    """Names of all cached_property attributes defined on cls (values live in __dict__)."""
+    return tuple(
+        name
+        for klass in cls.__mro__
+        for name, attr in vars(klass).items()
+        if isinstance(attr, cached_property)
+    )
+
+
 def invalidate_cache(self, *property_names):
     """
     Invalidate cached properties on an instance.
@@ -146,78 +237,105 @@ def invalidate_cache(self, *property_names):
         property_names: Names of properties to invalidate. If none provided, 
                        invalidates all cached properties.
     """
+    instance_dict = self.__dict__
     if not property_names:
         # Invalidate all cached properties
-        attrs_to_remove = [attr for attr in dir(self) 
-                          if attr.startswith('_cached_') or attr.startswith('_lazy_')]
+        attrs_to_remove = list(_cached_property_names(type(self)))
+        attrs_to_remove.extend(attr for attr in instance_dict if attr.startswith('_lazy_'))
     else:
         # Invalidate specific properties
         attrs_to_remove = []
         for prop_name in property_names:
-            attrs_to_remove.extend([
-                f'_cached_{prop_name}',
-                f'_lazy_{prop_name}'
-            ])
+            attrs_to_remove.extend([prop_name, f'_lazy_{prop_name}'])
     
     for attr in attrs_to_remove:
-        if hasattr(self, attr):
-            delattr(self, attr)
+        instance_dict.pop(attr, None)
 
 
-class HighlightPosition(BaseModel):
+def _non_blank(label: str, intern: bool = False) -> AfterValidator:
     """
-    Represents a position within a Bible passage for highlighting purposes.
+    Build a validator that strips a string and rejects it if nothing is left.
     
-    Uses verse_index to reference a specific verse within a passage's verse list,
-    and word_index to reference a specific word within that verse.
+    Args:
+        label: Field name used in the error message
+        intern: Whether to sys.intern the result (for values repeated across many models)
     """
-    verse_index: int = Field(..., ge=0, description="Index of verse in passage.verses list")
-    word_index: int = Field(..., ge=0, description="Index of word within the verse")
+    def validate(v: str) -> str:
+        v = v.strip()
+        if not v:
+            raise ValueError(f'{label} cannot be empty or just whitespace')
+        return sys.intern(v) if intern else v
+    return AfterValidator(validate)
+
+
+# String field types shared by the models; book and version names repeat across every verse/passage
+BookName = Annotated[str, _non_blank('Book name', intern=True)]
+VerseText = Annotated[str, _non_blank('Verse text')]
+Reference = Annotated[str, _non_blank('Reference')]
+VersionName = Annotated[str, _non_blank('Version', intern=True)]
+
+
+def _build_word_layout(verses) -> tuple:
+    """
+    Flatten the words of a list of verses and record where each verse starts.
     
-    def __lt__(self, other: 'HighlightPosition') -> bool:
-        """
-        Enable position comparison for sorting highlights.
+    Args:
+        verses: Sequence of BibleVerse objects
         
-        Args:
-            other: Another HighlightPosition to compare against
-            
-        Returns:
-            True if this position comes before the other position
-        """
-        if self.verse_index != other.verse_index:
-            return self.verse_index < other.verse_index
-        return self.word_index < other.word_index
-    
-    def __le__(self, other: 'HighlightPosition') -> bool:
-        """Less than or equal comparison."""
-        return self < other or self == other
+    Returns:
+        Tuple of (flat_words, offsets) with len(offsets) == len(verses) + 1
+    """
+    flat_words = []
+    offsets = [0]
+    for verse in verses:
+        flat_words.extend(verse.words)
+        offsets.append(len(flat_words))
+    return flat_words, offsets
+
+
+# Word indices must fit in the low 32 bits of HighlightPosition.key
+_WORD_INDEX_LIMIT = 1 << 32
+
+
+@dataclass(frozen=True, order=True)
+class HighlightPosition:
+    """
+    Represents a position within a Bible passage for highlighting purposes.
     
-    def __gt__(self, other: 'HighlightPosition') -> bool:
-        """Greater than comparison."""
-        return not self <= other
+    Uses verse_index to reference a specific verse within a passage's verse list,
+    and word_index to reference a specific word within that verse.
     
-    def __ge__(self, other: 'HighlightPosition') -> bool:
-        """Greater than or equal comparison."""
-        return not self < other
+    A plain slotted dataclass rather than a BaseModel: positions are built and
+    compared in tight loops, and order=True gives C-speed tuple-style ordering
+    on (verse_index, word_index) for sorting highlights.
     
-    def __eq__(self, other: object) -> bool:
-        """
-        Equality comparison for positions.
-        
-        Args:
-            other: Another object to compare against
-            
-        Returns:
-            True if both positions reference the same verse and word
-        """
-        if not isinstance(other, HighlightPosition):
-            return False
-        return (self.verse_index == other.verse_index and 
-                self.word_index == other.word_index)
+    key packs both indices into one int (verse_index << 32 | word_index) that
+    orders the same way, for hot paths where a single int compare is cheaper.
+    """
+    # Declared by hand: dataclass(slots=True) needs Python 3.10. key is a
+    # plain slot rather than a field, set in __post_init__.
+    __slots__ = ('verse_index', 'word_index', 'key')
+    
+    verse_index: int  # Index of verse in passage.verses list
+    word_index: int   # Index of word within the verse
+    
+    def __post_init__(self):
+        """Ensure both indices are in range and compute the packed key."""
+        if self.verse_index < 0:
+            raise ValueError(f"verse_index must be greater than or equal to 0, got {self.verse_index}")
+        if self.word_index < 0:
+            raise ValueError(f"word_index must be greater than or equal to 0, got {self.word_index}")
+        if self.word_index >= _WORD_INDEX_LIMIT:
+            raise ValueError(f"word_index must be less than {_WORD_INDEX_LIMIT}, got {self.word_index}")
+        object.__setattr__(self, 'key', (self.verse_index << 32) | self.word_index)
     
     def __hash__(self) -> int:
-        """Enable use as dictionary key or in sets."""
-        return hash((self.verse_index, self.word_index))
+        """Enable use as dictionary key or in sets (the packed key; positions are frozen)."""
+        return self.key
+    
+    def __reduce__(self):
+        """Pickle and copy through __init__, since frozen slots cannot be set directly."""
+        return type(self), (self.verse_index, self.word_index)
     
     def __str__(self) -> str:
         """Human-readable string representation."""
@@ -234,7 +352,9 @@ class HighlightPosition(BaseModel):
         Returns:
             JSON string representation of the position
         """
-        return self.model_dump_json()
+        if orjson is not None:
+            return orjson.dumps(self.to_dict()).decode()
+        return json.dumps(self.to_dict(), separators=(',', ':'))
     
     @classmethod
     def from_json(cls, json_str: str) -> 'HighlightPosition':
@@ -250,7 +370,7 @@ class HighlightPosition(BaseModel):
         Raises:
             ValueError: If JSON is invalid or data doesn't match schema
         """
-        return cls.model_validate_json(json_str)
+        return cls.from_dict(json.loads(json_str))
     
     def to_dict(self) -> Dict[str, Any]:
         """
@@ -259,7 +379,7 @@ class HighlightPosition(BaseModel):
         Returns:
             Dictionary representation suitable for JSON
         """
-        return self.model_dump()
+        return {'verse_index': self.verse_index, 'word_index': self.word_index}
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'HighlightPosition':
@@ -275,7 +395,26 @@ class HighlightPosition(BaseModel):
         Raises:
             ValueError: If data doesn't match schema
         """
-        return cls.model_validate(data)
+        try:
+            return cls(verse_index=int(data['verse_index']), word_index=int(data['word_index']))
+        except (KeyError, TypeError) as e:
+            raise ValueError(f"Invalid HighlightPosition data: {data!r}") from e
+    
+    @classmethod
+    def from_dict_trusted(cls, data: Dict[str, Any]) -> 'HighlightPosition':
+        """
+        Create from dictionary data this application serialized itself.
+        
+        Skips the int coercion and error wrapping of from_dict; use from_dict
+        for anything that came from outside the process.
+        
+        Args:
+            data: Dictionary produced by to_dict
+            
+        Returns:
+            HighlightPosition object
+        """
+        return cls(data['verse_index'], data['word_index'])
 
 
 class BibleVerse(BaseModel):
@@ -285,26 +424,17 @@ class BibleVerse(BaseModel):
     Contains the actual verse text along with its location (book, chapter, verse)
     and provides computed properties for statistics and text manipulation.
     """
-    book: str = Field(..., min_length=1, description="Bible book name (e.g., 'Genesis', '1 Kings')")
+    model_config = ConfigDict(ignored_types=(cached_property,))
+    
+    book: BookName = Field(..., min_length=1, description="Bible book name (e.g., 'Genesis', '1 Kings')")
     chapter: int = Field(..., gt=0, description="Chapter number (must be positive)")
     verse: int = Field(..., gt=0, description="Verse number (must be positive)")
-    text: str = Field(..., min_length=1, description="The actual verse text (cannot be empty)")
+    text: VerseText = Field(..., min_length=1, description="The actual verse text (cannot be empty)")
     
-    @field_validator('book')
-    @classmethod
-    def validate_book_name(cls, v):
-        """Ensure book name is not just whitespace."""
-        if not v.strip():
-            raise ValueError('Book name cannot be empty or just whitespace')
-        return v.strip()
-    
-    @field_validator('text')
-    @classmethod
-    def validate_text_content(cls, v):
-        """Ensure verse text is not just whitespace."""
-        if not v.strip():
-            raise ValueError('Verse text cannot be empty or just whitespace')
-        return v.strip()
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Drop cached word data and the reference when a field is reassigned."""
+        super().__setattr__(name, value)
+        invalidate_cache(self)
     
     @cached_property
     def word_count(self) -> int:
@@ -314,7 +444,7 @@ class BibleVerse(BaseModel):
         Returns:
             Count of words separated by whitespace
         """
-        return len(self.text.split())
+        return len(self.words)
     
     @cached_property
     def char_count(self) -> int:
@@ -379,6 +509,8 @@ class BibleVerse(BaseModel):
         Returns:
             JSON string representation of the verse
         """
+        if orjson is not None:
+            return orjson.dumps(self.to_dict()).decode()
         return self.model_dump_json()
     
     @classmethod
@@ -404,7 +536,12 @@ class BibleVerse(BaseModel):
         Returns:
             Dictionary representation suitable for JSON
         """
-        return self.model_dump()
+        return {
+            'book': self.book,
+            'chapter': self.chapter,
+            'verse': self.verse,
+            'text': self.text
+        }
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'BibleVerse':
@@ -422,6 +559,22 @@ class BibleVerse(BaseModel):
         """
         return cls.model_validate(data)
     
+    @classmethod
+    def from_dict_trusted(cls, data: Dict[str, Any]) -> 'BibleVerse':
+        """
+        Create from dictionary data this application serialized itself.
+        
+        Uses model_construct, so no validation runs and the word split is
+        deferred to first use. Use from_dict for external input.
+        
+        Args:
+            data: Dictionary produced by to_dict
+            
+        Returns:
+            BibleVerse object
+        """
+        return cls.model_construct(**data)
+    
     def format_display(self, show_reference: bool = True, max_width: int = 80) -> str:
         """
         Format verse for display with optional reference and word wrapping.
@@ -435,27 +588,35 @@ class BibleVerse(BaseModel):
         """
         if show_reference:
             reference_text = f"{self.reference}: "
-            available_width = max_width - len(reference_text)
+            ref_len = len(reference_text)
         else:
             reference_text = ""
-            available_width = max_width
+            ref_len = 0
+        available_width = max_width - ref_len
+        
+        # Short verses fit on one line: joining the words with single spaces
+        # can only shorten the text, so no wrapping is needed
+        if len(self.text) <= available_width:
+            return reference_text + ' '.join(self.words)
         
         # Simple word wrapping
-        words = self.text.split()
         lines = []
         current_line = []
         current_length = 0
         
-        for word in words:
-            word_length = len(word) + (1 if current_line else 0)  # +1 for space
+        for word in self.words:
+            word_len = len(word)
             
-            if current_length + word_length <= available_width or not current_line:
+            if not current_line:
                 current_line.append(word)
-                current_length += word_length
+                current_length = word_len
+            elif current_length + word_len + 1 <= available_width:  # +1 for space
+                current_line.append(word)
+                current_length += word_len + 1
             else:
                 lines.append(' '.join(current_line))
                 current_line = [word]
-                current_length = len(word)
+                current_length = word_len
         
         if current_line:
             lines.append(' '.join(current_line))
@@ -463,8 +624,8 @@ class BibleVerse(BaseModel):
         # Add reference to first line and indent subsequent lines
         if show_reference and lines:
             lines[0] = reference_text + lines[0]
-            indent = ' ' * len(reference_text)
-            lines[1:] = [indent + line for line in lines[1:]]
+            if len(lines) > 1:
+                return ('\n' + ' ' * ref_len).join(lines)
         
         return '\n'.join(lines)
     
@@ -519,51 +680,30 @@ class BibleHighlight(BaseModel):
             IndexError: If highlight positions are invalid for the passage
             ValueError: If passage doesn't contain enough verses
         """
-        # Validate that the passage has enough verses
-        if len(passage.verses) <= max(self.start_position.verse_index, self.end_position.verse_index):
-            raise ValueError(f"Passage only has {len(passage.verses)} verses, but highlight references verse {max(self.start_position.verse_index, self.end_position.verse_index)}")
+        start_vi, start_wi = self.start_position.verse_index, self.start_position.word_index
+        end_vi, end_wi = self.end_position.verse_index, self.end_position.word_index
         
-        # Single verse highlight
-        if not self.spans_multiple_verses():
-            verse = passage.verses[self.start_position.verse_index]
-            words = verse.get_words()
-            
-            # Validate word indices
-            if self.start_position.word_index >= len(words):
-                raise IndexError(f"Start word index {self.start_position.word_index} is beyond verse length {len(words)}")
-            if self.end_position.word_index >= len(words):
-                raise IndexError(f"End word index {self.end_position.word_index} is beyond verse length {len(words)}")
-            
-            # Extract highlighted words (inclusive range)
-            highlighted_words = words[self.start_position.word_index:self.end_position.word_index + 1]
-            return ' '.join(highlighted_words)
+        # Validate all bounds up front; end >= start is guaranteed by the model validator
+        verse_count = len(passage.verses)
+        if end_vi >= verse_count:
+            raise ValueError(f"Passage only has {verse_count} verses, but highlight references verse {end_vi}")
         
-        # Multi-verse highlight
-        highlighted_parts = []
+        if isinstance(passage, BiblePassage):
+            flat_words, verse_offsets = passage._word_layout
+        else:
+            flat_words, verse_offsets = _build_word_layout(passage.verses)
         
-        # Process each verse in the highlight range
-        for verse_idx in range(self.start_position.verse_index, self.end_position.verse_index + 1):
-            verse = passage.verses[verse_idx]
-            words = verse.get_words()
-            
-            if verse_idx == self.start_position.verse_index:
-                # First verse: from start_position to end of verse
-                if self.start_position.word_index >= len(words):
-                    raise IndexError(f"Start word index {self.start_position.word_index} is beyond verse length {len(words)}")
-                highlighted_words = words[self.start_position.word_index:]
-            elif verse_idx == self.end_position.verse_index:
-                # Last verse: from beginning to end_position
-                if self.end_position.word_index >= len(words):
-                    raise IndexError(f"End word index {self.end_position.word_index} is beyond verse length {len(words)}")
-                highlighted_words = words[:self.end_position.word_index + 1]
-            else:
-                # Middle verses: entire verse
-                highlighted_words = words
-            
-            if highlighted_words:
-                highlighted_parts.append(' '.join(highlighted_words))
+        start_len = verse_offsets[start_vi + 1] - verse_offsets[start_vi]
+        if start_wi >= start_len:
+            raise IndexError(f"Start word index {start_wi} is beyond verse length {start_len}")
+        end_len = verse_offsets[end_vi + 1] - verse_offsets[end_vi]
+        if end_wi >= end_len:
+            raise IndexError(f"End word index {end_wi} is beyond verse length {end_len}")
         
-        return ' '.join(highlighted_parts)
+        # Extract highlighted words (inclusive range) as one slice of the passage's words
+        start_abs = verse_offsets[start_vi] + start_wi
+        end_abs = verse_offsets[end_vi] + end_wi + 1
+        return ' '.join(flat_words[start_abs:end_abs])
     
     def __str__(self) -> str:
         """Human-readable string representation."""
@@ -580,6 +720,8 @@ class BibleHighlight(BaseModel):
         Returns:
             JSON string representation of the highlight
         """
+        if orjson is not None:
+            return orjson.dumps(self.to_dict()).decode()
         return self.model_dump_json()
     
     @classmethod
@@ -605,7 +747,11 @@ class BibleHighlight(BaseModel):
         Returns:
             Dictionary representation suitable for JSON
         """
-        return self.model_dump()
+        return {
+            'start_position': self.start_position.to_dict(),
+            'end_position': self.end_position.to_dict(),
+            'highlight_count': self.highlight_count
+        }
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'BibleHighlight':
@@ -623,6 +769,26 @@ class BibleHighlight(BaseModel):
         """
         return cls.model_validate(data)
     
+    @classmethod
+    def from_dict_trusted(cls, data: Dict[str, Any]) -> 'BibleHighlight':
+        """
+        Create from dictionary data this application serialized itself.
+        
+        Uses model_construct, so no validation runs. Use from_dict for
+        external input.
+        
+        Args:
+            data: Dictionary produced by to_dict
+            
+        Returns:
+            BibleHighlight object
+        """
+        return cls.model_construct(
+            start_position=HighlightPosition.from_dict_trusted(data['start_position']),
+            end_position=HighlightPosition.from_dict_trusted(data['end_position']),
+            highlight_count=data.get('highlight_count', 1)
+        )
+    
     def format_display(self, passage: 'BiblePassage', show_context: bool = True, 
                       context_words: int = 3) -> str:
         """
@@ -651,21 +817,11 @@ class BibleHighlight(BaseModel):
                 start_context = max(0, self.start_position.word_index - context_words)
                 end_context = min(len(words), self.end_position.word_index + 1 + context_words)
                 
-                # Build context with highlight markers
-                context_parts = []
-                
-                # Before highlight
-                if start_context < self.start_position.word_index:
-                    before_words = words[start_context:self.start_position.word_index]
-                    context_parts.append(' '.join(before_words))
-                
-                # Highlighted text with markers
+                # Build context with highlight markers: words before, the marked
+                # highlight, then words after, joined in a single pass
+                context_parts = words[start_context:self.start_position.word_index]
                 context_parts.append(f"**{highlighted_text}**")
-                
-                # After highlight
-                if self.end_position.word_index + 1 < end_context:
-                    after_words = words[self.end_position.word_index + 1:end_context]
-                    context_parts.append(' '.join(after_words))
+                context_parts.extend(words[self.end_position.word_index + 1:end_context])
                 
                 context_text = ' '.join(context_parts)
                 verse_ref = verse.reference
@@ -724,6 +880,52 @@ class BibleHighlight(BaseModel):
             return "Invalid position"
 
 
+def _index_tokens(postings: Dict[str, Set[int]], highlight_id: int, lowered_text: str) -> None:
+    """Add the words of one highlight's lowercased text to a token index."""
+    for token in set(lowered_text.split()):
+        postings.setdefault(token, set()).add(highlight_id)
+
+
+def _counts_mutation(method):
+    """Wrap a list method so each call bumps the list's mutation counter."""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        self.mutations += 1
+        return method(self, *args, **kwargs)
+    return wrapper
+
+
+class _HighlightList(list):
+    """
+    List that counts its in-place changes.
+    
+    BiblePassage compares the count with the one its highlight caches were
+    built from, so replacing, appending or deleting items directly on
+    passage.highlights is noticed even when the length stays the same.
+    """
+    mutations = 0
+    
+    append = _counts_mutation(list.append)
+    extend = _counts_mutation(list.extend)
+    insert = _counts_mutation(list.insert)
+    pop = _counts_mutation(list.pop)
+    remove = _counts_mutation(list.remove)
+    clear = _counts_mutation(list.clear)
+    sort = _counts_mutation(list.sort)
+    reverse = _counts_mutation(list.reverse)
+    __setitem__ = _counts_mutation(list.__setitem__)
+    __delitem__ = _counts_mutation(list.__delitem__)
+    __iadd__ = _counts_mutation(list.__iadd__)
+    __imul__ = _counts_mutation(list.__imul__)
+
+
+# Cached properties on BiblePassage that are derived from its highlights. The
+# index is kept up to date by add/remove; the views are rebuilt when stale.
+_HIGHLIGHT_VIEW_CACHES = ('_highlights_by_verse', '_lowered_highlight_texts', '_highlight_token_index',
+                          '_coverage_mask', '_covered_words')
+_HIGHLIGHT_CACHES = ('_highlight_index',) + _HIGHLIGHT_VIEW_CACHES
+
+
 class BiblePassage(BaseModel):
     """
     Represents a Bible passage containing multiple verses with metadata and highlights.
@@ -731,27 +933,19 @@ class BiblePassage(BaseModel):
     Provides aggregation features for metadata calculation, highlight management,
     and support for complex multi-chapter and multi-book passages.
     """
-    reference: str = Field(..., min_length=1, description="Human-readable reference (e.g., 'Luke 1:1-38')")
-    version: str = Field(default="NKJV", description="Bible version")
+    model_config = ConfigDict(ignored_types=(cached_property,))
+    
+    reference: Reference = Field(..., min_length=1, description="Human-readable reference (e.g., 'Luke 1:1-38')")
+    version: VersionName = Field(default="NKJV", description="Bible version")
     verses: List[BibleVerse] = Field(..., min_length=1, description="List of verses in the passage")
-    highlights: List[BibleHighlight] = Field(default_factory=list, description="User highlights")
+    highlights: List[BibleHighlight] = Field(default_factory=_HighlightList, description="User highlights")
     fetched_at: datetime = Field(default_factory=datetime.now, description="When passage was fetched")
     
-    @field_validator('reference')
-    @classmethod
-    def validate_reference(cls, v):
-        """Ensure reference is not just whitespace."""
-        if not v.strip():
-            raise ValueError('Reference cannot be empty or just whitespace')
-        return v.strip()
-    
-    @field_validator('version')
+    @field_validator('highlights')
     @classmethod
-    def validate_version(cls, v):
-        """Ensure version is not just whitespace."""
-        if not v.strip():
-            raise ValueError('Version cannot be empty or just whitespace')
-        return v.strip()
+    def track_highlights(cls, highlights: List[BibleHighlight]) -> List[BibleHighlight]:
+        """Hold highlights in a list that counts in-place changes; see _HighlightList."""
+        return _HighlightList(highlights)
     
     @cached_property
     def total_verses(self) -> int:
@@ -763,7 +957,22 @@ class BiblePassage(BaseModel):
         """
         return len(self.verses)
     
-    @lazy_property
+    @model_validator(mode='after')
+    def precompute_totals(self):
+        """
+        Count words and characters across all verses in a single pass and
+        store them where the total_words/total_characters properties look.
+        """
+        total_words = total_characters = 0
+        for verse in self.verses:
+            total_words += verse.word_count
+            total_characters += verse.char_count
+        instance_dict = self.__dict__
+        instance_dict['total_words'] = total_words
+        instance_dict['total_characters'] = total_characters
+        return self
+    
+    @cached_property
     def total_words(self) -> int:
         """
         Total word count across all verses in the passage.
@@ -773,7 +982,7 @@ class BiblePassage(BaseModel):
         """
         return sum(verse.word_count for verse in self.verses)
     
-    @lazy_property
+    @cached_property
     def total_characters(self) -> int:
         """
         Total character count across all verses in the passage.
@@ -783,6 +992,238 @@ class BiblePassage(BaseModel):
         """
         return sum(verse.char_count for verse in self.verses)
     
+    @cached_property
+    def _word_layout(self) -> tuple:
+        """
+        All words of the passage in one list, plus verse start offsets.
+        
+        Verse i's words are flat_words[offsets[i]:offsets[i + 1]], so a
+        highlight spanning any number of verses is a single slice.
+        
+        Returns:
+            Tuple of (flat_words, offsets) with len(offsets) == len(verses) + 1
+        """
+        return _build_word_layout(self.verses)
+    
+    @cached_property
+    def _word_counts(self) -> tuple:
+        """
+        Word count of each verse, in passage order.
+        
+        Returns:
+            Tuple with one entry per verse
+        """
+        return tuple(verse.word_count for verse in self.verses)
+    
+    @cached_property
+    def _verse_memory_bytes(self) -> int:
+        """
+        Estimated bytes held by the verses, computed once per verse list.
+        
+        Returns:
+            Approximate memory used by verse text, book names and verse objects
+        """
+        getsizeof = sys.getsizeof
+        return sum(getsizeof(verse.text) + getsizeof(verse.book) + 64 for verse in self.verses)
+    
+    @cached_property
+    def _verse_index_map(self) -> Dict[tuple, int]:
+        """
+        Index of each verse in the passage, keyed by (book, chapter, verse).
+        
+        If a verse appears twice the first index wins, as a front-to-back
+        scan would find it.
+        
+        Returns:
+            Dictionary mapping verse identity to its index
+        """
+        index_map = {}
+        for i, v in enumerate(self.verses):
+            index_map.setdefault((v.book, v.chapter, v.verse), i)
+        return index_map
+    
+    @cached_property
+    def _highlight_index(self) -> Dict[tuple, BibleHighlight]:
+        """
+        Highlights keyed by (start_position, end_position) for O(1) lookup.
+        
+        If the list holds duplicates the first one wins, as a front-to-back
+        scan would find it.
+        
+        Returns:
+            Dictionary mapping position pairs to highlights
+        """
+        index = {}
+        for highlight in self.highlights:
+            index.setdefault((highlight.start_position, highlight.end_position), highlight)
+        return index
+    
+    def _get_highlight_index(self) -> Dict[tuple, BibleHighlight]:
+        """
+        Get the highlight index, rebuilding the highlight caches if the list
+        changed since they were built (e.g. a highlight replaced or appended
+        directly rather than through add_highlight).
+        
+        Returns:
+            Dictionary mapping position pairs to highlights
+        """
+        instance_dict = self.__dict__
+        highlights = self.highlights
+        if not isinstance(highlights, _HighlightList):
+            # Set without validation, e.g. by model_construct
+            highlights = instance_dict['highlights'] = _HighlightList(highlights)
+        seen = instance_dict.get('_highlights_seen')
+        if seen is None or seen[0] is not highlights or seen[1] != highlights.mutations:
+            self._invalidate_highlight_caches()
+            self._mark_highlights_seen()
+        return self._highlight_index
+    
+    def _mark_highlights_seen(self) -> None:
+        """Record the list state the highlight caches are in step with."""
+        highlights = self.highlights
+        self.__dict__['_highlights_seen'] = (highlights, highlights.mutations)
+    
+    @cached_property
+    def _highlights_by_verse(self) -> List[List[BibleHighlight]]:
+        """
+        For each verse index, the highlights that cover it, in list order.
+        
+        Turns per-verse queries into a list lookup instead of a scan over
+        every highlight. Multi-verse highlights appear in each verse they span.
+        
+        Returns:
+            List with one list of highlights per verse
+        """
+        buckets = [[] for _ in self.verses]
+        for highlight in self.highlights:
+            for verse_idx in range(highlight.start_position.verse_index,
+                                   min(highlight.end_position.verse_index + 1, len(buckets))):
+                buckets[verse_idx].append(highlight)
+        return buckets
+    
+    @cached_property
+    def _lowered_highlight_texts(self) -> Dict[int, str]:
+        """
+        Lowercased text of each highlight, keyed by id(highlight).
+        
+        Text searches compare against these instead of re-extracting and
+        lowercasing every highlight per query. Highlights with invalid
+        positions are left out.
+        
+        Returns:
+            Dictionary mapping id(highlight) to its lowercased text
+        """
+        texts = {}
+        for highlight in self.highlights:
+            self._lower_highlight_text(texts, highlight)
+        return texts
+    
+    def _lower_highlight_text(self, texts: Dict[int, str], highlight: BibleHighlight) -> Optional[str]:
+        """Add one highlight's lowercased text to texts and return it (None if invalid)."""
+        try:
+            lowered_text = highlight.get_highlighted_text(self).lower()
+        except (IndexError, ValueError):
+            return None
+        texts[id(highlight)] = lowered_text
+        return lowered_text
+    
+    @cached_property
+    def _highlight_token_index(self) -> Dict[str, Set[int]]:
+        """
+        Inverted index from lowercased word to the ids of highlights containing it.
+        
+        Text searches use it to narrow the candidates before the substring
+        check.
+        
+        Returns:
+            Dictionary mapping each word to a set of id(highlight)
+        """
+        postings = {}
+        for highlight_id, lowered_text in self._lowered_highlight_texts.items():
+            _index_tokens(postings, highlight_id, lowered_text)
+        return postings
+    
+    def _flat_span(self, start_position: HighlightPosition, end_position: HighlightPosition) -> tuple:
+        """
+        Flat word range [start, end) covered by a pair of positions.
+        
+        Word indices beyond the end of a verse are cut back to the verse end.
+        
+        Returns:
+            Tuple of (start, end) offsets into the passage's flat word list
+        """
+        verse_offsets = self._word_layout[1]
+        start_vi = start_position.verse_index
+        end_vi = end_position.verse_index
+        
+        start_flat = verse_offsets[start_vi] + start_position.word_index
+        if start_flat > verse_offsets[start_vi + 1]:
+            start_flat = verse_offsets[start_vi + 1]
+        end_flat = verse_offsets[end_vi] + end_position.word_index + 1
+        if end_flat > verse_offsets[end_vi + 1]:
+            end_flat = verse_offsets[end_vi + 1]
+        return start_flat, end_flat
+    
+    @cached_property
+    def _coverage_mask(self) -> bytearray:
+        """
+        One byte per word in the passage, set to 1 where any highlight covers it.
+        
+        Each highlight becomes a single slice assignment over the flat word
+        positions, so the cost is one C-level fill per highlight rather than a
+        Python loop per word. add_highlight keeps it up to date in place.
+        
+        Returns:
+            bytearray of length total words
+        """
+        mask = bytearray(self._word_layout[1][-1])
+        flat_span = self._flat_span
+        
+        for highlight in self.highlights:
+            start_flat, end_flat = flat_span(highlight.start_position, highlight.end_position)
+            if end_flat > start_flat:
+                mask[start_flat:end_flat] = b'\x01' * (end_flat - start_flat)
+        
+        return mask
+    
+    @cached_property
+    def _covered_words(self) -> int:
+        """
+        Number of words covered by at least one highlight.
+        
+        Returns:
+            Count of set bytes in the coverage mask
+        """
+        return self._coverage_mask.count(1)
+    
+    def _covered_word_count(self) -> int:
+        """
+        Number of highlighted words, rebuilt only if the highlight list changed
+        behind the passage's back.
+        
+        Returns:
+            Count of words covered by at least one highlight
+        """
+        self._get_highlight_index()
+        return self._covered_words
+    
+    def _invalidate_highlight_caches(self) -> None:
+        """Drop cached values derived from self.highlights."""
+        instance_dict = self.__dict__
+        for name in _HIGHLIGHT_CACHES:
+            instance_dict.pop(name, None)
+        instance_dict.pop('_highlights_seen', None)
+    
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Keep cached values in step when the verses or highlights list is replaced."""
+        if name == 'highlights' and not isinstance(value, _HighlightList):
+            value = _HighlightList(value)
+        super().__setattr__(name, value)
+        if name == 'highlights':
+            self._invalidate_highlight_caches()
+        elif name == 'verses':
+            invalidate_cache(self)
+    
     @cached_property
     def books(self) -> List[str]:
         """
@@ -791,13 +1232,7 @@ class BiblePassage(BaseModel):
         Returns:
             Ordered list of unique book names in the passage
         """
-        seen = set()
-        result = []
-        for verse in self.verses:
-            if verse.book not in seen:
-                seen.add(verse.book)
-                result.append(verse.book)
-        return result
+        return list(dict.fromkeys(verse.book for verse in self.verses))
     
     @cached_property
     def chapter_range(self) -> str:
@@ -826,6 +1261,33 @@ class BiblePassage(BaseModel):
         # Different chapters
         return f"{first_verse.chapter}:{first_verse.verse}-{last_verse.chapter}:{last_verse.verse}"
     
+    def _check_highlight_positions(self, start_position: HighlightPosition,
+                                   end_position: HighlightPosition) -> None:
+        """
+        Check that a pair of positions makes a valid highlight in this passage.
+        
+        Raises:
+            ValueError: If positions are invalid for this passage
+        """
+        # Validate positions are within bounds
+        max_verse_index = len(self.verses) - 1
+        if start_position.verse_index > max_verse_index or end_position.verse_index > max_verse_index:
+            raise ValueError(f"Highlight positions reference verses beyond passage length ({len(self.verses)} verses)")
+        
+        # Validate word indices
+        word_counts = self._word_counts
+        start_verse_length = word_counts[start_position.verse_index]
+        end_verse_length = word_counts[end_position.verse_index]
+        
+        if start_position.word_index >= start_verse_length:
+            raise ValueError(f"Start word index {start_position.word_index} is beyond verse length {start_verse_length}")
+        
+        if end_position.word_index >= end_verse_length:
+            raise ValueError(f"End word index {end_position.word_index} is beyond verse length {end_verse_length}")
+        
+        if end_position < start_position:
+            raise ValueError('End position must be after or equal to start position')
+    
     def add_highlight(self, start_position: HighlightPosition, end_position: HighlightPosition) -> BibleHighlight:
         """
         Add a new highlight to the passage or increment existing highlight count.
@@ -840,48 +1302,107 @@ class BiblePassage(BaseModel):
         Raises:
             ValueError: If positions are invalid for this passage
         """
-        # Validate positions are within bounds
-        max_verse_index = len(self.verses) - 1
-        if start_position.verse_index > max_verse_index or end_position.verse_index > max_verse_index:
-            raise ValueError(f"Highlight positions reference verses beyond passage length ({len(self.verses)} verses)")
-        
-        # Validate word indices
-        start_verse = self.verses[start_position.verse_index]
-        end_verse = self.verses[end_position.verse_index]
-        
-        if start_position.word_index >= len(start_verse.get_words()):
-            raise ValueError(f"Start word index {start_position.word_index} is beyond verse length {len(start_verse.get_words())}")
-        
-        if end_position.word_index >= len(end_verse.get_words()):
-            raise ValueError(f"End word index {end_position.word_index} is beyond verse length {len(end_verse.get_words())}")
+        self._check_highlight_positions(start_position, end_position)
         
         # Check if highlight already exists
-        for highlight in self.highlights:
-            if (highlight.start_position == start_position and 
-                highlight.end_position == end_position):
-                highlight.highlight_count += 1
-                return highlight
-        
-        # Create new highlight
-        new_highlight = BibleHighlight(
+        index = self._get_highlight_index()
+        key = (start_position, end_position)
+        highlight = index.get(key)
+        if highlight is not None:
+            highlight.highlight_count += 1
+            return highlight
+        
+        # Create new highlight; the positions were fully checked above
+        new_highlight = BibleHighlight.model_construct(
             start_position=start_position,
             end_position=end_position,
             highlight_count=1
         )
         self.highlights.append(new_highlight)
+        self._mark_highlights_seen()
+        index[key] = new_highlight
+        buckets = self.__dict__.get('_highlights_by_verse')
+        if buckets is not None:
+            for verse_idx in range(start_position.verse_index, end_position.verse_index + 1):
+                buckets[verse_idx].append(new_highlight)
+        instance_dict = self.__dict__
+        texts = instance_dict.get('_lowered_highlight_texts')
+        if texts is not None:
+            lowered_text = self._lower_highlight_text(texts, new_highlight)
+            postings = instance_dict.get('_highlight_token_index')
+            if postings is not None and lowered_text is not None:
+                _index_tokens(postings, id(new_highlight), lowered_text)
+        else:
+            instance_dict.pop('_highlight_token_index', None)
+        mask = instance_dict.get('_coverage_mask')
+        if mask is not None:
+            # Only the new span can change; count what it adds before filling it
+            start_flat, end_flat = self._flat_span(start_position, end_position)
+            newly_covered = (end_flat - start_flat) - mask.count(1, start_flat, end_flat)
+            mask[start_flat:end_flat] = b'\x01' * (end_flat - start_flat)
+            if '_covered_words' in instance_dict:
+                instance_dict['_covered_words'] += newly_covered
         return new_highlight
     
-    def get_popular_highlights(self, min_count: int = 1) -> List[BibleHighlight]:
+    def add_highlights_bulk(self, events) -> int:
+        """
+        Add many highlight events at once, e.g. when loading stored user highlights.
+        
+        Repeated (start, end) pairs are counted up front, so each distinct
+        highlight is looked up and updated once however often it occurs.
+        Every pair is validated before anything is added.
+        
+        Args:
+            events: Iterable of (start_position, end_position) pairs
+            
+        Returns:
+            Number of new highlights created
+            
+        Raises:
+            ValueError: If any positions are invalid for this passage
+        """
+        event_counts = Counter(events)
+        for start_position, end_position in event_counts:
+            self._check_highlight_positions(start_position, end_position)
+        
+        index = self._get_highlight_index()
+        created = 0
+        for key, count in event_counts.items():
+            highlight = index.get(key)
+            if highlight is not None:
+                highlight.highlight_count += count
+                continue
+            new_highlight = BibleHighlight.model_construct(
+                start_position=key[0],
+                end_position=key[1],
+                highlight_count=count
+            )
+            self.highlights.append(new_highlight)
+            index[key] = new_highlight
+            created += 1
+        
+        if created:
+            self._mark_highlights_seen()
+            instance_dict = self.__dict__
+            for name in _HIGHLIGHT_VIEW_CACHES:
+                instance_dict.pop(name, None)
+        return created
+    
+    def get_popular_highlights(self, min_count: int = 1, limit: Optional[int] = None) -> List[BibleHighlight]:
         """
         Get highlights sorted by popularity (highlight count).
         
         Args:
             min_count: Minimum highlight count to include
+            limit: If given, return only the top `limit` highlights
             
         Returns:
             List of highlights sorted by count (descending)
         """
         filtered_highlights = [h for h in self.highlights if h.highlight_count >= min_count]
+        if limit is not None:
+            # Top-k selection without sorting the whole list; ties keep list order
+            return heapq.nlargest(limit, filtered_highlights, key=lambda h: h.highlight_count)
         return sorted(filtered_highlights, key=lambda h: h.highlight_count, reverse=True)
     
     def merge_overlapping_highlights(self) -> None:
@@ -894,60 +1415,53 @@ class BiblePassage(BaseModel):
         if len(self.highlights) <= 1:
             return
         
+        # Already sorted with a gap after each highlight (the usual state after
+        # loading a tidy list): nothing to merge, so skip the sort entirely
+        highlights = self.highlights
+        previous_end_key = highlights[0].end_position.key
+        for highlight in itertools.islice(highlights, 1, None):
+            if highlight.start_position.key <= previous_end_key + 1:
+                break
+            previous_end_key = highlight.end_position.key
+        else:
+            return
+        
         # Sort highlights by start position
-        sorted_highlights = sorted(self.highlights, key=lambda h: h.start_position)
+        sorted_highlights = sorted(highlights, key=lambda h: h.start_position.key)
+        starts = [h.start_position.key for h in sorted_highlights]
+        ends = [h.end_position.key for h in sorted_highlights]
+        
+        # Find the runs with int comparisons only: a highlight joins the run if
+        # it overlaps it or starts on the word right after the run ends in the
+        # same verse (packed keys differ by exactly one)
+        run_bounds = []
+        run_first = run_last = 0
+        run_end_key = ends[0]
+        for i in range(1, len(starts)):
+            if starts[i] <= run_end_key + 1:
+                if ends[i] > run_end_key:
+                    run_end_key = ends[i]
+                    run_last = i
+                continue
+            run_bounds.append((run_first, i, run_last))
+            run_first = run_last = i
+            run_end_key = ends[i]
+        run_bounds.append((run_first, len(starts), run_last))
+        
+        # A highlight that merges with nothing is kept as is; each merged run
+        # is built once, without revalidating positions already validated
         merged = []
-        current = sorted_highlights[0]
-        
-        for next_highlight in sorted_highlights[1:]:
-            # Check if highlights overlap or are adjacent
-            if self._highlights_overlap_or_adjacent(current, next_highlight):
-                # Merge highlights
-                current = self._merge_two_highlights(current, next_highlight)
-            else:
-                merged.append(current)
-                current = next_highlight
-        
-        merged.append(current)
+        for first, stop, last in run_bounds:
+            if stop - first == 1:
+                merged.append(sorted_highlights[first])
+                continue
+            merged.append(BibleHighlight.model_construct(
+                start_position=sorted_highlights[first].start_position,
+                end_position=sorted_highlights[last].end_position,
+                highlight_count=sum(h.highlight_count for h in sorted_highlights[first:stop])
+            ))
         self.highlights = merged
     
-    def _highlights_overlap_or_adjacent(self, h1: BibleHighlight, h2: BibleHighlight) -> bool:
-        """
-        Check if two highlights overlap or are adjacent.
-        
-        Args:
-            h1: First highlight
-            h2: Second highlight
-            
-        Returns:
-            True if highlights overlap or are adjacent
-        """
-        # h2 starts before or at h1 ends (allowing for adjacent highlights)
-        return h2.start_position <= h1.end_position or (
-            h1.end_position.verse_index == h2.start_position.verse_index and
-            h1.end_position.word_index + 1 == h2.start_position.word_index
-        )
-    
-    def _merge_two_highlights(self, h1: BibleHighlight, h2: BibleHighlight) -> BibleHighlight:
-        """
-        Merge two highlights into one.
-        
-        Args:
-            h1: First highlight
-            h2: Second highlight
-            
-        Returns:
-            New merged highlight
-        """
-        start_pos = h1.start_position if h1.start_position <= h2.start_position else h2.start_position
-        end_pos = h1.end_position if h1.end_position >= h2.end_position else h2.end_position
-        
-        return BibleHighlight(
-            start_position=start_pos,
-            end_position=end_pos,
-            highlight_count=h1.highlight_count + h2.highlight_count
-        )
-    
     def get_highlight_coverage(self) -> float:
         """
         Calculate what percentage of the passage is highlighted.
@@ -958,34 +1472,9 @@ class BiblePassage(BaseModel):
         if not self.highlights or self.total_words == 0:
             return 0.0
         
-        highlighted_words = set()
-        
-        for highlight in self.highlights:
-            # Add all word positions covered by this highlight
-            for verse_idx in range(highlight.start_position.verse_index, highlight.end_position.verse_index + 1):
-                verse = self.verses[verse_idx]
-                words = verse.get_words()
-                
-                if verse_idx == highlight.start_position.verse_index and verse_idx == highlight.end_position.verse_index:
-                    # Single verse highlight
-                    for word_idx in range(highlight.start_position.word_index, highlight.end_position.word_index + 1):
-                        if word_idx < len(words):
-                            highlighted_words.add((verse_idx, word_idx))
-                elif verse_idx == highlight.start_position.verse_index:
-                    # First verse of multi-verse highlight
-                    for word_idx in range(highlight.start_position.word_index, len(words)):
-                        highlighted_words.add((verse_idx, word_idx))
-                elif verse_idx == highlight.end_position.verse_index:
-                    # Last verse of multi-verse highlight
-                    for word_idx in range(0, highlight.end_position.word_index + 1):
-                        if word_idx < len(words):
-                            highlighted_words.add((verse_idx, word_idx))
-                else:
-                    # Middle verse of multi-verse highlight
-                    for word_idx in range(len(words)):
-                        highlighted_words.add((verse_idx, word_idx))
-        
-        return (len(highlighted_words) / self.total_words) * 100.0
+        # One byte per word in a flat bytearray rather than a set of
+        # (verse, word) tuples; see _coverage_mask
+        return (self._covered_word_count() / self.total_words) * 100.0
     
     def search_highlights(self, text_query: str = None, min_count: int = None, 
                          verse_range: tuple = None, spans_multiple: bool = None) -> List[BibleHighlight]:
@@ -1024,15 +1513,36 @@ class BiblePassage(BaseModel):
         # Filter by text content
         if text_query is not None:
             text_query_lower = text_query.lower()
+            query_tokens = text_query_lower.split()
+            self._get_highlight_index()
+            # A query word with whitespace on both sides must be a whole word
+            # of any matching highlight, so look those words up exactly. The
+            # first and last words may be partial and are left to the
+            # substring check below.
+            starts_whole = text_query_lower[:1].isspace()
+            ends_whole = text_query_lower[-1:].isspace()
+            last = len(query_tokens) - 1
+            whole_tokens = [token for i, token in enumerate(query_tokens)
+                            if (i > 0 or starts_whole) and (i < last or ends_whole)]
+            if whole_tokens:
+                postings = self._highlight_token_index
+                candidates = None
+                for query_token in set(whole_tokens):
+                    matching = postings.get(query_token)
+                    if not matching:
+                        return []
+                    candidates = set(matching) if candidates is None else candidates & matching
+                    if not candidates:
+                        return []
+                results = [h for h in results if id(h) in candidates]
+            
+            lowered_texts = self._lowered_highlight_texts
             filtered_results = []
             for highlight in results:
-                try:
-                    highlighted_text = highlight.get_highlighted_text(self)
-                    if text_query_lower in highlighted_text.lower():
-                        filtered_results.append(highlight)
-                except (IndexError, ValueError):
-                    # Skip highlights with invalid positions
-                    continue
+                lowered_text = lowered_texts.get(id(highlight))
+                # Highlights with invalid positions have no cached text
+                if lowered_text is not None and text_query_lower in lowered_text:
+                    filtered_results.append(highlight)
             results = filtered_results
         
         return results
@@ -1057,25 +1567,40 @@ class BiblePassage(BaseModel):
             }
         
         total_highlights = len(self.highlights)
-        total_highlight_count = sum(h.highlight_count for h in self.highlights)
-        average_popularity = total_highlight_count / total_highlights if total_highlights > 0 else 0.0
-        most_popular_count = max(h.highlight_count for h in self.highlights)
+        total_highlight_count = 0
+        most_popular_count = 0
+        single_verse = 0
+        verses_with_highlights = set()
+        
+        # One pass over the highlights for every aggregate
+        for highlight in self.highlights:
+            count = highlight.highlight_count
+            total_highlight_count += count
+            if count > most_popular_count:
+                most_popular_count = count
+            
+            start_verse = highlight.start_position.verse_index
+            end_verse = highlight.end_position.verse_index
+            if start_verse == end_verse:
+                single_verse += 1
+                verses_with_highlights.add(start_verse)
+            else:
+                verses_with_highlights.update(range(start_verse, end_verse + 1))
         
-        single_verse = sum(1 for h in self.highlights if not h.spans_multiple_verses())
         multi_verse = total_highlights - single_verse
+        average_popularity = total_highlight_count / total_highlights
         
-        # Count verses that have at least one highlight
-        verses_with_highlights = set()
-        for highlight in self.highlights:
-            for verse_idx in range(highlight.start_position.verse_index, highlight.end_position.verse_index + 1):
-                verses_with_highlights.add(verse_idx)
+        if self.total_words:
+            coverage = self._covered_word_count() / self.total_words * 100.0
+        else:
+            coverage = 0.0
         
         return {
             'total_highlights': total_highlights,
             'total_highlight_count': total_highlight_count,
             'average_popularity': round(average_popularity, 2),
             'most_popular_count': most_popular_count,
-            'coverage_percentage': round(self.get_highlight_coverage(), 2),
+            'coverage_percentage': round(coverage, 2),
             'single_verse_highlights': single_verse,
             'multi_verse_highlights': multi_verse,
             'verses_with_highlights': len(verses_with_highlights)
@@ -1092,12 +1617,44 @@ class BiblePassage(BaseModel):
         Returns:
             True if highlight was found and removed, False otherwise
         """
-        for i, highlight in enumerate(self.highlights):
-            if (highlight.start_position == start_position and 
-                highlight.end_position == end_position):
+        highlight = self._get_highlight_index().pop((start_position, end_position), None)
+        if highlight is None:
+            return False
+        for i, candidate in enumerate(self.highlights):
+            if candidate is highlight:
                 del self.highlights[i]
-                return True
-        return False
+                break
+        self._mark_highlights_seen()
+        instance_dict = self.__dict__
+        for name in _HIGHLIGHT_VIEW_CACHES:
+            instance_dict.pop(name, None)
+        return True
+    
+    def remove_highlights(self, positions) -> int:
+        """
+        Remove many highlights in one pass over the highlight list.
+        
+        Args:
+            positions: Iterable of (start_position, end_position) pairs
+            
+        Returns:
+            Number of highlights that were removed
+        """
+        index = self._get_highlight_index()
+        removed_ids = set()
+        for key in positions:
+            highlight = index.pop(key, None)
+            if highlight is not None:
+                removed_ids.add(id(highlight))
+        if not removed_ids:
+            return 0
+        
+        self.highlights[:] = [h for h in self.highlights if id(h) not in removed_ids]
+        self._mark_highlights_seen()
+        instance_dict = self.__dict__
+        for name in _HIGHLIGHT_VIEW_CACHES:
+            instance_dict.pop(name, None)
+        return len(removed_ids)
     
     def clear_highlights(self) -> int:
         """
@@ -1108,6 +1665,7 @@ class BiblePassage(BaseModel):
         """
         count = len(self.highlights)
         self.highlights.clear()
+        self._invalidate_highlight_caches()
         return count
     
     def get_highlights_by_verse(self, verse_index: int) -> List[BibleHighlight]:
@@ -1123,8 +1681,8 @@ class BiblePassage(BaseModel):
         if verse_index < 0 or verse_index >= len(self.verses):
             return []
         
-        return [h for h in self.highlights 
-                if (h.start_position.verse_index <= verse_index <= h.end_position.verse_index)]
+        self._get_highlight_index()  # Drops stale caches if the list was edited directly
+        return list(self._highlights_by_verse[verse_index])
     
     def invalidate_cache(self, *property_names):
         """
@@ -1146,14 +1704,11 @@ class BiblePassage(BaseModel):
         Returns:
             Compact JSON string representation
         """
-        # Use Pydantic's built-in JSON serialization which handles datetime properly
+        # Pydantic's serializer writes JSON straight from the model, datetimes
+        # included, and beats dumping an intermediate dict with json or orjson
         if exclude_highlights:
-            # Create a copy without highlights
-            data = self.model_dump(exclude={'highlights'})
-            return json.dumps(data, separators=(',', ':'), ensure_ascii=False, default=str)
-        else:
-            # Use Pydantic's optimized JSON serialization
-            return self.model_dump_json()
+            return self.model_dump_json(exclude={'highlights'})
+        return self.model_dump_json()
     
     @classmethod
     @PerformanceMonitor.time_function
@@ -1176,11 +1731,8 @@ class BiblePassage(BaseModel):
         Returns:
             Dictionary with memory usage information
         """
-        import sys
-        
         # Calculate approximate memory usage
-        verse_memory = sum(sys.getsizeof(verse.text) + sys.getsizeof(verse.book) + 64 
-                          for verse in self.verses)
+        verse_memory = self._verse_memory_bytes
         highlight_memory = len(self.highlights) * 128  # Approximate size per highlight
         metadata_memory = (sys.getsizeof(self.reference) + 
                           sys.getsizeof(self.version) + 64)
@@ -1209,47 +1761,7 @@ class BiblePassage(BaseModel):
         if not self.highlights or self.total_words == 0:
             return 0.0
         
-        # Use a more efficient algorithm for large passages
-        highlighted_words = 0
-        
-        # Create a bitmap for each verse to track highlighted words
-        verse_bitmaps = {}
-        
-        for highlight in self.highlights:
-            for verse_idx in range(highlight.start_position.verse_index, 
-                                 highlight.end_position.verse_index + 1):
-                if verse_idx not in verse_bitmaps:
-                    verse_word_count = len(self.verses[verse_idx].get_words())
-                    verse_bitmaps[verse_idx] = [False] * verse_word_count
-                
-                verse = self.verses[verse_idx]
-                words = verse.get_words()
-                
-                if verse_idx == highlight.start_position.verse_index and verse_idx == highlight.end_position.verse_index:
-                    # Single verse highlight
-                    start_word = min(highlight.start_position.word_index, len(words) - 1)
-                    end_word = min(highlight.end_position.word_index, len(words) - 1)
-                    for word_idx in range(start_word, end_word + 1):
-                        verse_bitmaps[verse_idx][word_idx] = True
-                elif verse_idx == highlight.start_position.verse_index:
-                    # First verse of multi-verse highlight
-                    start_word = min(highlight.start_position.word_index, len(words) - 1)
-                    for word_idx in range(start_word, len(words)):
-                        verse_bitmaps[verse_idx][word_idx] = True
-                elif verse_idx == highlight.end_position.verse_index:
-                    # Last verse of multi-verse highlight
-                    end_word = min(highlight.end_position.word_index, len(words) - 1)
-                    for word_idx in range(0, end_word + 1):
-                        verse_bitmaps[verse_idx][word_idx] = True
-                else:
-                    # Middle verse of multi-verse highlight
-                    for word_idx in range(len(words)):
-                        verse_bitmaps[verse_idx][word_idx] = True
-        
-        # Count highlighted words
-        for bitmap in verse_bitmaps.values():
-            highlighted_words += sum(bitmap)
-        
+        highlighted_words = self._covered_word_count()
         return (highlighted_words / self.total_words) * 100.0
     
     def __str__(self) -> str:
@@ -1292,7 +1804,13 @@ class BiblePassage(BaseModel):
         Returns:
             Dictionary representation suitable for JSON
         """
-        return self.model_dump()
+        return {
+            'reference': self.reference,
+            'version': self.version,
+            'verses': [verse.to_dict() for verse in self.verses],
+            'highlights': [highlight.to_dict() for highlight in self.highlights],
+            'fetched_at': self.fetched_at.isoformat()
+        }
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'BiblePassage':
@@ -1310,6 +1828,30 @@ class BiblePassage(BaseModel):
         """
         return cls.model_validate(data)
     
+    @classmethod
+    def from_dict_trusted(cls, data: Dict[str, Any]) -> 'BiblePassage':
+        """
+        Create from dictionary data this application serialized itself.
+        
+        Uses model_construct for the passage and every nested verse and
+        highlight, so no validation runs. Suited to in-process round-trips
+        and test fixtures; on-disk and S3 caches can be stale or corrupt and
+        should keep going through from_dict.
+        
+        Args:
+            data: Dictionary produced by to_dict
+            
+        Returns:
+            BiblePassage object
+        """
+        fields = dict(data)
+        fields['verses'] = [BibleVerse.from_dict_trusted(v) for v in data['verses']]
+        fields['highlights'] = [BibleHighlight.from_dict_trusted(h) for h in data.get('highlights', ())]
+        fetched_at = data.get('fetched_at')
+        if isinstance(fetched_at, str):
+            fields['fetched_at'] = datetime.fromisoformat(fetched_at)
+        return cls.model_construct(**fields)
+    
     def format_display(self, show_metadata: bool = True, show_highlights: bool = True, 
                       max_verses: int = 10, max_width: int = 80) -> str:
         """
@@ -1324,61 +1866,61 @@ class BiblePassage(BaseModel):
         Returns:
             Formatted passage string ready for display
         """
-        lines = []
-        
+        return '\n'.join(self._iter_display_lines(show_metadata, show_highlights, max_verses, max_width))
+    
+    def _iter_display_lines(self, show_metadata: bool, show_highlights: bool,
+                            max_verses: int, max_width: int):
+        """Yield the lines of format_display one at a time."""
         # Header with reference and version
         header = f"📖 {self.reference} ({self.version})"
-        lines.append(header)
-        lines.append("─" * len(header))
+        yield header
+        yield "─" * len(header)
         
         # Metadata section
         if show_metadata:
-            metadata_lines = []
-            metadata_lines.append(f"📊 {self.total_verses} verses, {self.total_words} words, {self.total_characters} characters")
+            yield f"📊 {self.total_verses} verses, {self.total_words} words, {self.total_characters} characters"
             
             if len(self.books) > 1:
-                metadata_lines.append(f"📚 Books: {', '.join(self.books)}")
+                yield f"📚 Books: {', '.join(self.books)}"
             
-            metadata_lines.append(f"📖 Chapter range: {self.chapter_range}")
+            yield f"📖 Chapter range: {self.chapter_range}"
             
             if show_highlights and self.highlights:
                 coverage = self.get_highlight_coverage()
-                metadata_lines.append(f"✨ {len(self.highlights)} highlights ({coverage:.1f}% coverage)")
+                yield f"✨ {len(self.highlights)} highlights ({coverage:.1f}% coverage)"
             
-            lines.extend(metadata_lines)
-            lines.append("")
+            yield ""
         
         # Verses section
         verses_to_show = self.verses[:max_verses] if max_verses > 0 else self.verses
+        add_indicators = show_highlights and self.highlights
         
         for verse in verses_to_show:
-            verse_text = verse.format_display(show_reference=True, max_width=max_width)
+            yield verse.format_display(show_reference=True, max_width=max_width)
             
             # Add highlight visualization if enabled
-            if show_highlights and self.highlights:
-                verse_text = self._add_highlight_visualization(verse_text, verse, max_width)
-            
-            lines.append(verse_text)
+            if add_indicators:
+                yield from self._iter_highlight_indicators(verse)
         
         # Show truncation message if needed
         if max_verses > 0 and len(self.verses) > max_verses:
             remaining = len(self.verses) - max_verses
-            lines.append(f"\n... and {remaining} more verses")
+            yield ""
+            yield f"... and {remaining} more verses"
         
         # Highlights section
         if show_highlights and self.highlights:
-            lines.append("\n" + "─" * 40)
-            lines.append("HIGHLIGHTS:")
+            yield ""
+            yield "─" * 40
+            yield "HIGHLIGHTS:"
             
-            popular_highlights = self.get_popular_highlights()[:5]  # Show top 5
+            popular_highlights = self.get_popular_highlights(limit=5)  # Show top 5
             for i, highlight in enumerate(popular_highlights, 1):
                 highlight_text = highlight.format_display(self, show_context=True)
-                lines.append(f"{i}. {highlight_text}")
+                yield f"{i}. {highlight_text}"
             
             if len(self.highlights) > 5:
-                lines.append(f"... and {len(self.highlights) - 5} more highlights")
-        
-        return '\n'.join(lines)
+                yield f"... and {len(self.highlights) - 5} more highlights"
     
     def format_compact(self) -> str:
         """
@@ -1426,106 +1968,93 @@ class BiblePassage(BaseModel):
         Returns:
             Formatted verses with highlight markers
         """
-        lines = []
-        
+        return '\n'.join(self._iter_verses_with_highlights(max_width))
+    
+    def _iter_verses_with_highlights(self, max_width: int):
+        """Yield each formatted verse followed by its highlight indicator lines."""
         for verse in self.verses:
-            verse_text = verse.format_display(show_reference=True, max_width=max_width)
-            verse_text = self._add_highlight_visualization(verse_text, verse, max_width)
-            lines.append(verse_text)
-        
-        return '\n'.join(lines)
+            yield verse.format_display(show_reference=True, max_width=max_width)
+            yield from self._iter_highlight_indicators(verse)
     
-    def _add_highlight_visualization(self, verse_text: str, verse: BibleVerse, max_width: int) -> str:
+    def _iter_highlight_indicators(self, verse: BibleVerse):
         """
-        Add highlight visualization to verse text.
+        Yield one indicator line for each highlight touching a verse.
         
         Args:
-            verse_text: Original formatted verse text
             verse: The BibleVerse object
-            max_width: Maximum line width
             
-        Returns:
-            Verse text with highlight markers
+        Yields:
+            Highlight marker lines to show under the verse text
         """
         if not self.highlights:
-            return verse_text
+            return
         
         # Find verse index in passage
-        verse_index = -1
-        for i, v in enumerate(self.verses):
-            if (v.book == verse.book and v.chapter == verse.chapter and v.verse == verse.verse):
-                verse_index = i
-                break
+        verse_index = self._verse_index_map.get((verse.book, verse.chapter, verse.verse), -1)
         
         if verse_index == -1:
-            return verse_text
-        
-        # Find highlights that affect this verse
-        verse_highlights = []
-        for highlight in self.highlights:
-            if (highlight.start_position.verse_index <= verse_index <= highlight.end_position.verse_index):
-                verse_highlights.append(highlight)
+            return
         
-        if not verse_highlights:
-            return verse_text
+        # The verse's words are split once and memoised on the verse
+        words = verse.words
+        word_count = len(words)
         
-        # Add highlight indicators
-        highlight_indicators = []
-        for highlight in verse_highlights:
+        # Find highlights that affect this verse
+        for highlight in self.get_highlights_by_verse(verse_index):
             if highlight.spans_multiple_verses():
                 if verse_index == highlight.start_position.verse_index:
-                    highlight_indicators.append(f"  ✨ Highlight starts here (by {highlight.highlight_count} users)")
+                    yield f"  ✨ Highlight starts here (by {highlight.highlight_count} users)"
                 elif verse_index == highlight.end_position.verse_index:
-                    highlight_indicators.append(f"  ✨ Highlight ends here (by {highlight.highlight_count} users)")
+                    yield f"  ✨ Highlight ends here (by {highlight.highlight_count} users)"
                 else:
-                    highlight_indicators.append(f"  ✨ Part of multi-verse highlight (by {highlight.highlight_count} users)")
+                    yield f"  ✨ Part of multi-verse highlight (by {highlight.highlight_count} users)"
             else:
-                words = verse.get_words()
                 start_word = highlight.start_position.word_index
                 end_word = highlight.end_position.word_index
-                if start_word < len(words) and end_word < len(words):
+                if start_word < word_count and end_word < word_count:
                     highlighted_words = words[start_word:end_word + 1]
-                    highlight_indicators.append(f"  ✨ \"{' '.join(highlighted_words)}\" (by {highlight.highlight_count} users)")
-        
-        if highlight_indicators:
-            return verse_text + '\n' + '\n'.join(highlight_indicators)
-        
-        return verse_text
+                    yield f"  ✨ \"{' '.join(highlighted_words)}\" (by {highlight.highlight_count} users)"
     
-    def format_highlights_summary(self) -> str:
+    def format_highlights_summary(self, limit: Optional[int] = None) -> str:
         """
-        Format a summary of all highlights in the passage.
+        Format a summary of the highlights in the passage, most popular first.
         
+        Args:
+            limit: If given, list only the top `limit` highlights
+            
         Returns:
             Formatted highlights summary
         """
         if not self.highlights:
             return "No highlights in this passage."
         
-        lines = [f"✨ HIGHLIGHTS SUMMARY ({len(self.highlights)} total):"]
-        lines.append("─" * 40)
+        return '\n'.join(self._iter_highlights_summary_lines(limit))
+    
+    def _iter_highlights_summary_lines(self, limit: Optional[int] = None):
+        """Yield the lines of format_highlights_summary one at a time."""
+        yield f"✨ HIGHLIGHTS SUMMARY ({len(self.highlights)} total):"
+        yield "─" * 40
         
-        popular_highlights = self.get_popular_highlights()
+        popular_highlights = self.get_popular_highlights(limit=limit)
         
         for i, highlight in enumerate(popular_highlights, 1):
             position_desc = highlight.get_position_description(self)
             try:
-                text_preview = highlight.get_highlighted_text(self)[:50]
-                if len(highlight.get_highlighted_text(self)) > 50:
+                highlighted_text = highlight.get_highlighted_text(self)
+                text_preview = highlighted_text[:50]
+                if len(highlighted_text) > 50:
                     text_preview += "..."
             except (IndexError, ValueError):
                 text_preview = "[Invalid highlight]"
             
-            lines.append(f"{i}. {position_desc}")
-            lines.append(f"   \"{text_preview}\"")
-            lines.append(f"   Highlighted by {highlight.highlight_count} users")
-            lines.append("")
+            yield f"{i}. {position_desc}"
+            yield f"   \"{text_preview}\""
+            yield f"   Highlighted by {highlight.highlight_count} users"
+            yield ""
         
         # Add coverage statistics
         coverage = self.get_highlight_coverage()
-        lines.append(f"Total coverage: {coverage:.1f}% of passage")
-        
-        return '\n'.join(lines)
+        yield f"Total coverage: {coverage:.1f}% of passage"
     
     def to_json_file(self, filepath: str) -> None:
         """
@@ -6,9 +6,133 @@ handling complex verse ranges and text normalization for the M'Cheyne reading sy
 """
 
 import re
-from typing import List, Tuple, Optional, Dict
+from collections import Counter
+from functools import lru_cache
+from types import MappingProxyType
+from typing import List, NamedTuple, Tuple, Optional, Dict
 from bible_models import BibleVerse, BiblePassage
 from datetime import datetime
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+# Reference pattern: book and chapter, then optional verse, end verse and
+# end chapter. Only the start is anchored, so trailing text is ignored.
+_REF_RE = re.compile(
+    r'(?P<book>\d?\s*[A-Za-z]+)\s+(?P<c1>\d+)'
+    r'(?::(?P<v1>\d+)(?:-(?:(?P<c2>\d+):)?(?P<v2>\d+))?)?'
+)
+_NUMBERED_BOOK_RE = re.compile(r'^(\d+)\s*([a-z]+)$')
+
+# clean_verse_text
+_MULTIPLE_VERSE_NUMBERS_RE = re.compile(r'\d+\s+.*?\d+\s+')
+_LEADING_VERSE_NUMBER_RE = re.compile(r'^\d+\s*')
+_FOOTNOTE_MARKER_RE = re.compile(r'\[[abc]\]')  # Footnote markers like [a], [b], [c]
+_BRACKETED_RE = re.compile(r'\[.*?\]')
+_NOTE_WORDS = frozenset(('note', 'see', 'cf', 'compare', 'lit', 'or'))  # Marks bracketed notes
+
+# apply_proper_typography: apostrophes in contractions and possessives
+_APOSTROPHE_RE = re.compile(r"(?<=\w)'(?=\w)")  # it's, don't, we're, I've, I'll, I'd, I'm
+_ELLIPSIS_RE = re.compile(r'\.{3,}')
+
+# convert_double_quotes / convert_single_quotes: neighbouring characters that
+# mark a straight quote as opening or closing
+_OPEN_AFTER = frozenset('([{-—')
+_CLOSE_BEFORE = frozenset(')]}.,;:!?-—')
+_SENTENCE_PUNCTUATION = frozenset('.,;:!?')
+_WORD_END_PUNCTUATION = frozenset('.,;:!?)]}')
+_SINGLE_OPEN_AFTER = _OPEN_AFTER | {'"'}
+_SINGLE_CLOSE_BEFORE = _CLOSE_BEFORE | {'"'}
+
+# extract_verses_from_text
+# Each verse pattern is paired with the separator that must follow its verse numbers
+_VERSE_PATTERNS = (
+    (re.compile(r'(\d+)\s+([^0-9]+?)(?=\s*\d+\s+|$)', re.DOTALL), ' '),  # "1 Text here 2 More text"
+    (re.compile(r'(\d+)\.\s*([^0-9]+?)(?=\s*\d+\.|$)', re.DOTALL), '.'),  # "1. Text here 2. More text"
+    (re.compile(r'(\d+):\s*([^0-9]+?)(?=\s*\d+:|$)', re.DOTALL), ':'),   # "1: Text here 2: More text"
+)
+_VERSE_SEPARATOR_RE = re.compile(r'\d([.:]|\s)')
+_NUMBERED_LINE_RE = re.compile(r'^(\d+)\s+(.+)')
+_STANDALONE_NUMBER_RE = re.compile(r'\s+(\d+)\s+')
+_SENTENCE_BREAK_RE = re.compile(r'[.!?]+\s+')
+
+# Define YHWH patterns - these represent the tetragrammaton YHWH
+# Most English translations render YHWH as "LORD" in small caps
+# Use case-insensitive patterns with capture groups to preserve original case
+_YHWH_PATTERNS = [
+    # Primary patterns (99.9% of cases) - preserve case of "the/The"
+    (r'\b(the|The) Lord\b', r'\1 L{small_caps}ORD{/small_caps}'),
+    (r'\b(O|o) Lord\b', r'\1 L{small_caps}ORD{/small_caps}'),
+    
+    # Complex compound patterns
+    (r'\b(the|The) Lord God\b', r'\1 L{small_caps}ORD{/small_caps} God'),
+    (r'\b(O|o) Lord God\b', r'\1 L{small_caps}ORD{/small_caps} God'),
+    (r'\bLord God\b', 'L{small_caps}ORD{/small_caps} God'),
+    
+    # Additional YHWH compound names
+    (r'\b(the|The) Lord of hosts\b', r'\1 L{small_caps}ORD{/small_caps} of hosts'),
+    (r'\b(O|o) Lord of hosts\b', r'\1 L{small_caps}ORD{/small_caps} of hosts'),
+    (r'\bLord of hosts\b', 'L{small_caps}ORD{/small_caps} of hosts'),
+    
+    # YHWH with possessive
+    (r'\b(the|The) Lord\'s\b', r'\1 L{small_caps}ORD{/small_caps}\'s'),
+    (r'\bLord\'s\b', 'L{small_caps}ORD{/small_caps}\'s'),
+    
+    # Standalone Lord at sentence beginning (likely YHWH in most contexts)
+    (r'^Lord\b', 'L{small_caps}ORD{/small_caps}'),
+    (r'(?<=\. )Lord\b', 'L{small_caps}ORD{/small_caps}'),
+    (r'(?<=\! )Lord\b', 'L{small_caps}ORD{/small_caps}'),
+    (r'(?<=\? )Lord\b', 'L{small_caps}ORD{/small_caps}'),
+]
+
+# Compiled patterns with the small caps markup already substituted for each
+# output mode: HTML markup for web display, Unicode small caps for plain text
+# (Unicode small caps: ᴀʙᴄᴅᴇꜰɢʜɪᴊᴋʟᴍɴᴏᴘǫʀꜱᴛᴜᴠᴡxʏᴢ)
+_YHWH_HTML_SUBS = tuple(
+    (re.compile(pattern), replacement.replace(
+        '{small_caps}', '<span class="small-caps">'
+    ).replace('{/small_caps}', '</span>'))
+    for pattern, replacement in _YHWH_PATTERNS
+)
+_YHWH_PLAIN_SUBS = tuple(
+    (re.compile(pattern), replacement.replace('{small_caps}ORD{/small_caps}', 'ᴏʀᴅ'))
+    for pattern, replacement in _YHWH_PATTERNS
+)
+
+
+class _ParsedReference(NamedTuple):
+    """Components of a Bible reference; end_chapter is only set for cross-chapter ranges."""
+    book: str
+    start_chapter: int
+    start_verse: int
+    end_chapter: Optional[int] = None
+    end_verse: Optional[int] = None
+
+
+@lru_cache(maxsize=256)
+def _parse_reference(reference: str) -> Optional[_ParsedReference]:
+    """Parse a Bible reference, keeping the end of cross-chapter ranges; None if unparseable."""
+    reference = reference.strip()
+    
+    match = _REF_RE.match(reference)
+    if match:
+        book = match.group('book').strip()
+        chapter = int(match.group('c1'))
+        if match.group('c2') is not None:
+            # Cross-chapter range like "Zechariah 12:1-13:1"
+            return _ParsedReference(book, chapter, int(match.group('v1')),
+                                    int(match.group('c2')), int(match.group('v2')))
+        if match.group('v2') is not None:
+            # Verse range within a chapter like "Luke 1:1-38"
+            return _ParsedReference(book, chapter, int(match.group('v1')), end_verse=int(match.group('v2')))
+        if match.group('v1') is not None:
+            # Single verse like "John 3:16"
+            return _ParsedReference(book, chapter, int(match.group('v1')))
+        # Whole chapter like "Genesis 1"
+        return _ParsedReference(book, chapter, 1)  # Start from verse 1
+    
+    return None
 
 
 def parse_bible_reference(reference: str) -> Tuple[str, int, int, Optional[int]]:
@@ -28,48 +152,101 @@ def parse_bible_reference(reference: str) -> Tuple[str, int, int, Optional[int]]
         "John 3:16" -> ("John", 3, 16, None)   # Single verse
         "Zechariah 12:1-13:1" -> ("Zechariah", 12, 1, None)  # Cross-chapter range
     """
-    reference = reference.strip()
-    
-    # Pattern for complex references like "Zechariah 12:1-13:1"
-    cross_chapter_pattern = r'(\d?\s*[A-Za-z]+)\s+(\d+):(\d+)-(\d+):(\d+)'
-    match = re.match(cross_chapter_pattern, reference)
-    if match:
-        book = match.group(1).strip()
-        start_chapter = int(match.group(2))
-        start_verse = int(match.group(3))
-        # For cross-chapter ranges, we'll handle them specially
-        return book, start_chapter, start_verse, None
-    
-    # Pattern for verse ranges within a chapter like "Luke 1:1-38"
-    verse_range_pattern = r'(\d?\s*[A-Za-z]+)\s+(\d+):(\d+)-(\d+)'
-    match = re.match(verse_range_pattern, reference)
-    if match:
-        book = match.group(1).strip()
-        chapter = int(match.group(2))
-        start_verse = int(match.group(3))
-        end_verse = int(match.group(4))
-        return book, chapter, start_verse, end_verse
-    
-    # Pattern for single verse like "John 3:16"
-    single_verse_pattern = r'(\d?\s*[A-Za-z]+)\s+(\d+):(\d+)'
-    match = re.match(single_verse_pattern, reference)
-    if match:
-        book = match.group(1).strip()
-        chapter = int(match.group(2))
-        verse = int(match.group(3))
-        return book, chapter, verse, None
-    
-    # Pattern for whole chapter like "Genesis 1"
-    chapter_pattern = r'(\d?\s*[A-Za-z]+)\s+(\d+)'
-    match = re.match(chapter_pattern, reference)
-    if match:
-        book = match.group(1).strip()
-        chapter = int(match.group(2))
-        return book, chapter, 1, None  # Start from verse 1
-    
-    raise ValueError(f"Could not parse Bible reference: {reference}")
+    parsed = _parse_reference(reference)
+    if parsed is None:
+        raise ValueError(f"Could not parse Bible reference: {reference.strip()}")
+    if parsed.end_chapter is not None:
+        # Cross-chapter ranges are handled specially, so only the start is reported
+        return parsed.book, parsed.start_chapter, parsed.start_verse, None
+    return parsed.book, parsed.start_chapter, parsed.start_verse, parsed.end_verse
+
 
+# Common book name mappings, keyed by lowercased name
+_BOOK_MAPPINGS = {
+    # Old Testament
+    'gen': 'Genesis', 'genesis': 'Genesis',
+    'ex': 'Exodus', 'exod': 'Exodus', 'exodus': 'Exodus',
+    'lev': 'Leviticus', 'leviticus': 'Leviticus',
+    'num': 'Numbers', 'numbers': 'Numbers',
+    'deut': 'Deuteronomy', 'deuteronomy': 'Deuteronomy',
+    'josh': 'Joshua', 'joshua': 'Joshua',
+    'judg': 'Judges', 'judges': 'Judges',
+    'ruth': 'Ruth',
+    '1sam': '1 Samuel', '1 sam': '1 Samuel', '1samuel': '1 Samuel',
+    '2sam': '2 Samuel', '2 sam': '2 Samuel', '2samuel': '2 Samuel',
+    '1kings': '1 Kings', '1 kings': '1 Kings', '1kgs': '1 Kings',
+    '2kings': '2 Kings', '2 kings': '2 Kings', '2kgs': '2 Kings',
+    '1chr': '1 Chronicles', '1 chr': '1 Chronicles', '1chronicles': '1 Chronicles',
+    '2chr': '2 Chronicles', '2 chr': '2 Chronicles', '2chronicles': '2 Chronicles',
+    'ezra': 'Ezra',
+    'neh': 'Nehemiah', 'nehemiah': 'Nehemiah',
+    'esth': 'Esther', 'esther': 'Esther',
+    'job': 'Job',
+    'ps': 'Psalms', 'psalm': 'Psalms', 'psalms': 'Psalms', 'psa': 'Psalms',
+    'prov': 'Proverbs', 'proverbs': 'Proverbs',
+    'eccl': 'Ecclesiastes', 'ecclesiastes': 'Ecclesiastes', 'ecc': 'Ecclesiastes',
+    'song': 'Song of Solomon', 'songs': 'Song of Solomon', 'sos': 'Song of Solomon',
+    'isa': 'Isaiah', 'isaiah': 'Isaiah',
+    'jer': 'Jeremiah', 'jeremiah': 'Jeremiah',
+    'lam': 'Lamentations', 'lamentations': 'Lamentations',
+    'ezek': 'Ezekiel', 'ezekiel': 'Ezekiel',
+    'dan': 'Daniel', 'daniel': 'Daniel',
+    'hos': 'Hosea', 'hosea': 'Hosea',
+    'joel': 'Joel',
+    'amos': 'Amos',
+    'obad': 'Obadiah', 'obadiah': 'Obadiah',
+    'jonah': 'Jonah',
+    'mic': 'Micah', 'micah': 'Micah',
+    'nah': 'Nahum', 'nahum': 'Nahum',
+    'hab': 'Habakkuk', 'habakkuk': 'Habakkuk',
+    'zeph': 'Zephaniah', 'zephaniah': 'Zephaniah',
+    'hag': 'Haggai', 'haggai': 'Haggai',
+    'zech': 'Zechariah', 'zechariah': 'Zechariah',
+    'mal': 'Malachi', 'malachi': 'Malachi',
+    
+    # New Testament
+    'matt': 'Matthew', 'matthew': 'Matthew', 'mt': 'Matthew',
+    'mark': 'Mark', 'mk': 'Mark',
+    'luke': 'Luke', 'lk': 'Luke',
+    'john': 'John', 'jn': 'John',
+    'acts': 'Acts',
+    'rom': 'Romans', 'romans': 'Romans',
+    '1cor': '1 Corinthians', '1 cor': '1 Corinthians', '1corinthians': '1 Corinthians',
+    '2cor': '2 Corinthians', '2 cor': '2 Corinthians', '2corinthians': '2 Corinthians',
+    'gal': 'Galatians', 'galatians': 'Galatians',
+    'eph': 'Ephesians', 'ephesians': 'Ephesians',
+    'phil': 'Philippians', 'philippians': 'Philippians',
+    'col': 'Colossians', 'colossians': 'Colossians',
+    '1thess': '1 Thessalonians', '1 thess': '1 Thessalonians', '1thessalonians': '1 Thessalonians',
+    '2thess': '2 Thessalonians', '2 thess': '2 Thessalonians', '2thessalonians': '2 Thessalonians',
+    '1tim': '1 Timothy', '1 tim': '1 Timothy', '1timothy': '1 Timothy',
+    '2tim': '2 Timothy', '2 tim': '2 Timothy', '2timothy': '2 Timothy',
+    'titus': 'Titus',
+    'philem': 'Philemon', 'philemon': 'Philemon',
+    'heb': 'Hebrews', 'hebrews': 'Hebrews',
+    'jas': 'James', 'james': 'James',
+    '1pet': '1 Peter', '1 pet': '1 Peter', '1peter': '1 Peter',
+    '2pet': '2 Peter', '2 pet': '2 Peter', '2peter': '2 Peter',
+    '1john': '1 John', '1 john': '1 John', '1jn': '1 John',
+    '2john': '2 John', '2 john': '2 John', '2jn': '2 John',
+    '3john': '3 John', '3 john': '3 John', '3jn': '3 John',
+    'jude': 'Jude',
+    'rev': 'Revelation', 'revelation': 'Revelation'
+}
 
+# Also key numbered books as "1 kings" for "1kings", so the usual spellings
+# resolve without the regex fallback in normalize_book_name
+_BOOK_LOOKUP = MappingProxyType({
+    **{
+        f"{m.group(1)} {m.group(2)}": name
+        for key, name in _BOOK_MAPPINGS.items()
+        if (m := _NUMBERED_BOOK_RE.match(key))
+    },
+    **_BOOK_MAPPINGS,
+})
+
+
+@lru_cache(maxsize=256)
 def normalize_book_name(book: str) -> str:
     """
     Normalize book names to standard format.
@@ -87,98 +264,32 @@ def normalize_book_name(book: str) -> str:
     """
     book = book.strip()
     
-    # Common book name mappings
-    book_mappings = {
-        # Old Testament
-        'gen': 'Genesis', 'genesis': 'Genesis',
-        'ex': 'Exodus', 'exod': 'Exodus', 'exodus': 'Exodus',
-        'lev': 'Leviticus', 'leviticus': 'Leviticus',
-        'num': 'Numbers', 'numbers': 'Numbers',
-        'deut': 'Deuteronomy', 'deuteronomy': 'Deuteronomy',
-        'josh': 'Joshua', 'joshua': 'Joshua',
-        'judg': 'Judges', 'judges': 'Judges',
-        'ruth': 'Ruth',
-        '1sam': '1 Samuel', '1 sam': '1 Samuel', '1samuel': '1 Samuel',
-        '2sam': '2 Samuel', '2 sam': '2 Samuel', '2samuel': '2 Samuel',
-        '1kings': '1 Kings', '1 kings': '1 Kings', '1kgs': '1 Kings',
-        '2kings': '2 Kings', '2 kings': '2 Kings', '2kgs': '2 Kings',
-        '1chr': '1 Chronicles', '1 chr': '1 Chronicles', '1chronicles': '1 Chronicles',
-        '2chr': '2 Chronicles', '2 chr': '2 Chronicles', '2chronicles': '2 Chronicles',
-        'ezra': 'Ezra',
-        'neh': 'Nehemiah', 'nehemiah': 'Nehemiah',
-        'esth': 'Esther', 'esther': 'Esther',
-        'job': 'Job',
-        'ps': 'Psalms', 'psalm': 'Psalms', 'psalms': 'Psalms', 'psa': 'Psalms',
-        'prov': 'Proverbs', 'proverbs': 'Proverbs',
-        'eccl': 'Ecclesiastes', 'ecclesiastes': 'Ecclesiastes', 'ecc': 'Ecclesiastes',
-        'song': 'Song of Solomon', 'songs': 'Song of Solomon', 'sos': 'Song of Solomon',
-        'isa': 'Isaiah', 'isaiah': 'Isaiah',
-        'jer': 'Jeremiah', 'jeremiah': 'Jeremiah',
-        'lam': 'Lamentations', 'lamentations': 'Lamentations',
-        'ezek': 'Ezekiel', 'ezekiel': 'Ezekiel',
-        'dan': 'Daniel', 'daniel': 'Daniel',
-        'hos': 'Hosea', 'hosea': 'Hosea',
-        'joel': 'Joel',
-        'amos': 'Amos',
-        'obad': 'Obadiah', 'obadiah': 'Obadiah',
-        'jonah': 'Jonah',
-        'mic': 'Micah', 'micah': 'Micah',
-        'nah': 'Nahum', 'nahum': 'Nahum',
-        'hab': 'Habakkuk', 'habakkuk': 'Habakkuk',
-        'zeph': 'Zephaniah', 'zephaniah': 'Zephaniah',
-        'hag': 'Haggai', 'haggai': 'Haggai',
-        'zech': 'Zechariah', 'zechariah': 'Zechariah',
-        'mal': 'Malachi', 'malachi': 'Malachi',
-        
-        # New Testament
-        'matt': 'Matthew', 'matthew': 'Matthew', 'mt': 'Matthew',
-        'mark': 'Mark', 'mk': 'Mark',
-        'luke': 'Luke', 'lk': 'Luke',
-        'john': 'John', 'jn': 'John',
-        'acts': 'Acts',
-        'rom': 'Romans', 'romans': 'Romans',
-        '1cor': '1 Corinthians', '1 cor': '1 Corinthians', '1corinthians': '1 Corinthians',
-        '2cor': '2 Corinthians', '2 cor': '2 Corinthians', '2corinthians': '2 Corinthians',
-        'gal': 'Galatians', 'galatians': 'Galatians',
-        'eph': 'Ephesians', 'ephesians': 'Ephesians',
-        'phil': 'Philippians', 'philippians': 'Philippians',
-        'col': 'Colossians', 'colossians': 'Colossians',
-        '1thess': '1 Thessalonians', '1 thess': '1 Thessalonians', '1thessalonians': '1 Thessalonians',
-        '2thess': '2 Thessalonians', '2 thess': '2 Thessalonians', '2thessalonians': '2 Thessalonians',
-        '1tim': '1 Timothy', '1 tim': '1 Timothy', '1timothy': '1 Timothy',
-        '2tim': '2 Timothy', '2 tim': '2 Timothy', '2timothy': '2 Timothy',
-        'titus': 'Titus',
-        'philem': 'Philemon', 'philemon': 'Philemon',
-        'heb': 'Hebrews', 'hebrews': 'Hebrews',
-        'jas': 'James', 'james': 'James',
-        '1pet': '1 Peter', '1 pet': '1 Peter', '1peter': '1 Peter',
-        '2pet': '2 Peter', '2 pet': '2 Peter', '2peter': '2 Peter',
-        '1john': '1 John', '1 john': '1 John', '1jn': '1 John',
-        '2john': '2 John', '2 john': '2 John', '2jn': '2 John',
-        '3john': '3 John', '3 john': '3 John', '3jn': '3 John',
-        'jude': 'Jude',
-        'rev': 'Revelation', 'revelation': 'Revelation'
-    }
-    
     # Try exact match first
     book_lower = book.lower()
-    if book_lower in book_mappings:
-        return book_mappings[book_lower]
+    name = _BOOK_LOOKUP.get(book_lower)
+    if name is not None:
+        return name
     
-    # Handle numbered books with spaces
-    numbered_book_pattern = r'^(\d+)\s*([a-z]+)$'
-    match = re.match(numbered_book_pattern, book_lower)
+    # Handle numbered books with unusual spacing
+    match = _NUMBERED_BOOK_RE.match(book_lower)
     if match:
-        number = match.group(1)
-        book_name = match.group(2)
-        full_key = f"{number}{book_name}"
-        if full_key in book_mappings:
-            return book_mappings[full_key]
+        name = _BOOK_LOOKUP.get(f"{match.group(1)}{match.group(2)}")
+        if name is not None:
+            return name
     
     # If no mapping found, return title case version
     return book.title()
 
 
+def _remove_bracketed_note(match: re.Match) -> str:
+    """Drop bracketed content that looks like a note, keeping anything else."""
+    bracketed = match.group(0)
+    lowered = bracketed.lower()
+    if any(word in lowered for word in _NOTE_WORDS):
+        return ''
+    return bracketed
+
+
 def clean_verse_text(text: str, book: str = None) -> str:
     """
     Clean and normalize verse text.
@@ -193,35 +304,35 @@ def clean_verse_text(text: str, book: str = None) -> str:
     if not text:
         return ""
     
+    # The book only matters for New Testament books, which skip YHWH typography,
+    # so Old Testament verses share cache entries regardless of book
+    if book and is_old_testament_book(book):
+        book = None
+    return _clean_verse_text(text, book)
+
+
+@lru_cache(maxsize=4096)
+def _clean_verse_text(text: str, book: Optional[str]) -> str:
+    """Cached implementation of clean_verse_text."""
     # Remove leading/trailing whitespace
     text = text.strip()
     
     # Remove verse numbers at the beginning ONLY if this is already an isolated verse
     # (Don't remove them if we're still parsing the full text)
-    if not re.search(r'\d+\s+.*?\d+\s+', text):  # Only if no multiple verse numbers
-        text = re.sub(r'^\d+\s*', '', text)
+    if not _MULTIPLE_VERSE_NUMBERS_RE.search(text):  # Only if no multiple verse numbers
+        text = _LEADING_VERSE_NUMBER_RE.sub('', text)
     
     # Normalize whitespace (replace multiple spaces/tabs/newlines with single space)
-    text = re.sub(r'\s+', ' ', text)
+    text = ' '.join(text.split())
     
     # Remove common web artifacts but be conservative
-    web_artifacts = [
-        r'\[a\]',  # Remove footnote markers like [a]
-        r'\[b\]',  # Remove footnote markers like [b]
-        r'\[c\]',  # Remove footnote markers like [c]
-    ]
-    
-    for pattern in web_artifacts:
-        text = re.sub(pattern, '', text)
+    text = _FOOTNOTE_MARKER_RE.sub('', text)
     
     # Remove bracketed content only if it looks like a note
-    bracketed_content = re.findall(r'\[.*?\]', text)
-    for match in bracketed_content:
-        if any(word in match.lower() for word in ['note', 'see', 'cf', 'compare', 'lit', 'or']):
-            text = text.replace(match, '')
+    text = _BRACKETED_RE.sub(_remove_bracketed_note, text)
     
     # Clean up any double spaces created by removals
-    text = re.sub(r'\s+', ' ', text).strip()
+    text = ' '.join(text.split())
     
     # Apply proper typography (with book context for YHWH typography)
     text = apply_proper_typography(text, book)
@@ -244,20 +355,14 @@ def apply_proper_typography(text: str, book: str = None) -> str:
         return ""
     
     # Replace escaped quotes first
-    text = text.replace('\\"', '"')
-    text = text.replace("\\'", "'")
+    if '\\' in text:
+        text = text.replace('\\"', '"')
+        text = text.replace("\\'", "'")
     
     # Handle apostrophes first (before quote processing)
     # This prevents apostrophes from being treated as quotes
-    apostrophe_patterns = [
-        (r"\b(\w+)'(s|t|re|ve|ll|d|m)\b", r"\1" + chr(8217) + r"\2"),  # it's, don't, we're, I've, I'll, I'd, I'm
-        (r"\b(\w+)'(\w+)\b", r"\1" + chr(8217) + r"\2"),  # general contractions
-        (r"(\w+)n't\b", r"\1n" + chr(8217) + r"t"),  # won't, can't, etc.
-        (r"(\w+)s'\b", r"\1s" + chr(8217)),  # possessive plural: boys', wits'
-    ]
-    
-    for pattern, replacement in apostrophe_patterns:
-        text = re.sub(pattern, replacement, text)
+    if "'" in text:
+        text = _APOSTROPHE_RE.sub(chr(8217), text)
     
     # Convert straight double quotes to proper typographic quotes
     # Use a more sophisticated approach that considers context
@@ -267,10 +372,13 @@ def apply_proper_typography(text: str, book: str = None) -> str:
     text = convert_single_quotes(text)
     
     # Handle em dashes (replace double hyphens)
+    # Plain str.replace is several times cheaper than folding this and the
+    # escaped quotes into one regex alternation with a callback
     text = text.replace('--', '—')
     
     # Handle ellipses
-    text = re.sub(r'\.{3,}', '…', text)
+    if '...' in text:
+        text = _ELLIPSIS_RE.sub('…', text)
     
     # Handle YHWH divine name typography (Old Testament only)
     text = apply_yhwh_typography(text, book)
@@ -291,63 +399,63 @@ def convert_double_quotes(text: str) -> str:
     if '"' not in text:
         return text
     
-    result = ""
-    i = 0
+    # Walk the text between quotes and collect the pieces to join once
+    parts = text.split('"')
+    last = len(parts) - 1
+    result = [parts[0]]
     quote_stack = []  # Stack to track nested quotes
     
-    while i < len(text):
-        char = text[i]
-        
-        if char == '"':
-            # Determine if this should be an opening or closing quote
-            # Look at the character before and after
-            prev_char = text[i-1] if i > 0 else ' '
-            next_char = text[i+1] if i < len(text) - 1 else ' '
-            
-            # Rules for opening quotes:
-            # 1. After whitespace, punctuation, or start of string
-            # 2. Not immediately after a letter (unless it's after punctuation)
-            is_opening = (
-                prev_char.isspace() or 
-                prev_char in '([{-—' or 
-                i == 0 or
-                (prev_char in '.,;:!?' and next_char.isalnum())
-            )
-            
-            # Rules for closing quotes:
-            # 1. Before whitespace, punctuation, or end of string
-            # 2. After a letter or punctuation
-            is_closing = (
-                next_char.isspace() or 
-                next_char in ')]}.,;:!?-—' or 
-                i == len(text) - 1 or
-                prev_char.isalnum()
-            )
-            
-            # Handle nested quotes by using the stack
-            if is_opening and not is_closing:
-                result += chr(8220)  # Left double quote "
+    for k in range(1, last + 1):
+        before = parts[k - 1]
+        after = parts[k]
+        
+        # Determine if this should be an opening or closing quote
+        # Look at the character before and after
+        prev_char = before[-1] if before else ('"' if k > 1 else ' ')
+        next_char = after[0] if after else ('"' if k < last else ' ')
+        
+        # Rules for opening quotes:
+        # 1. After whitespace, punctuation, or start of string
+        # 2. Not immediately after a letter (unless it's after punctuation)
+        is_opening = (
+            prev_char.isspace() or 
+            prev_char in _OPEN_AFTER or 
+            (k == 1 and not before) or
+            (prev_char in _SENTENCE_PUNCTUATION and next_char.isalnum())
+        )
+        
+        # Rules for closing quotes:
+        # 1. Before whitespace, punctuation, or end of string
+        # 2. After a letter or punctuation
+        is_closing = (
+            next_char.isspace() or 
+            next_char in _CLOSE_BEFORE or 
+            (k == last and not after) or
+            prev_char.isalnum()
+        )
+        
+        # Handle nested quotes by using the stack
+        if is_opening and not is_closing:
+            result.append(chr(8220))  # Left double quote "
+            quote_stack.append('double')
+        elif is_closing and not is_opening:
+            result.append(chr(8221))  # Right double quote "
+            if quote_stack and quote_stack[-1] == 'double':
+                quote_stack.pop()
+        else:
+            # Ambiguous case - use stack to decide
+            if not quote_stack or quote_stack[-1] != 'double':
+                # No open quote, so this is opening
+                result.append(chr(8220))  # Left double quote "
                 quote_stack.append('double')
-            elif is_closing and not is_opening:
-                result += chr(8221)  # Right double quote "
-                if quote_stack and quote_stack[-1] == 'double':
-                    quote_stack.pop()
             else:
-                # Ambiguous case - use stack to decide
-                if not quote_stack or quote_stack[-1] != 'double':
-                    # No open quote, so this is opening
-                    result += chr(8220)  # Left double quote "
-                    quote_stack.append('double')
-                else:
-                    # There's an open quote, so this is closing
-                    result += chr(8221)  # Right double quote "
-                    quote_stack.pop()
-        else:
-            result += char
+                # There's an open quote, so this is closing
+                result.append(chr(8221))  # Right double quote "
+                quote_stack.pop()
         
-        i += 1
+        result.append(after)
     
-    return result
+    return ''.join(result)
 
 
 def convert_single_quotes(text: str) -> str:
@@ -363,63 +471,89 @@ def convert_single_quotes(text: str) -> str:
     if "'" not in text:
         return text
     
-    result = ""
-    i = 0
+    parts = text.split("'")
+    last = len(parts) - 1
+    result = [parts[0]]
     quote_stack = []
     
-    while i < len(text):
-        char = text[i]
-        
-        if char == "'":
-            # Check if this is likely an apostrophe that wasn't caught earlier
-            prev_char = text[i-1] if i > 0 else ' '
-            next_char = text[i+1] if i < len(text) - 1 else ' '
+    for k in range(1, last + 1):
+        before = parts[k - 1]
+        after = parts[k]
+        
+        # Check if this is likely an apostrophe that wasn't caught earlier
+        prev_char = before[-1] if before else ("'" if k > 1 else ' ')
+        next_char = after[0] if after else ("'" if k < last else ' ')
+        
+        # Additional apostrophe patterns
+        if prev_char.isalpha() and (next_char.isspace() or next_char in _WORD_END_PUNCTUATION):
+            # This is likely a possessive or contraction at word end
+            result.append(chr(8217))  # Right single quote/apostrophe '
+        elif prev_char.isalpha() and next_char.isalpha():
+            # This is likely an apostrophe within a word
+            result.append(chr(8217))  # Right single quote/apostrophe '
+        else:
+            # This is likely a quotation mark
+            # Use similar logic as double quotes
+            is_opening = (
+                prev_char.isspace() or 
+                prev_char in _SINGLE_OPEN_AFTER or 
+                (k == 1 and not before)
+            )
             
-            # Additional apostrophe patterns
-            if prev_char.isalpha() and (next_char.isspace() or next_char in '.,;:!?)]}'):
-                # This is likely a possessive or contraction at word end
-                result += chr(8217)  # Right single quote/apostrophe '
-            elif prev_char.isalpha() and next_char.isalpha():
-                # This is likely an apostrophe within a word
-                result += chr(8217)  # Right single quote/apostrophe '
+            is_closing = (
+                next_char.isspace() or 
+                next_char in _SINGLE_CLOSE_BEFORE or 
+                (k == last and not after)
+            )
+            
+            if is_opening and not is_closing:
+                result.append(chr(8216))  # Left single quote '
+                quote_stack.append('single')
+            elif is_closing and not is_opening:
+                result.append(chr(8217))  # Right single quote '
+                if quote_stack and quote_stack[-1] == 'single':
+                    quote_stack.pop()
             else:
-                # This is likely a quotation mark
-                # Use similar logic as double quotes
-                is_opening = (
-                    prev_char.isspace() or 
-                    prev_char in '([{-—"' or 
-                    i == 0
-                )
-                
-                is_closing = (
-                    next_char.isspace() or 
-                    next_char in ')]}.,;:!?-—"' or 
-                    i == len(text) - 1
-                )
-                
-                if is_opening and not is_closing:
-                    result += chr(8216)  # Left single quote '
+                # Use stack to decide
+                if not quote_stack or quote_stack[-1] != 'single':
+                    result.append(chr(8216))  # Left single quote '
                     quote_stack.append('single')
-                elif is_closing and not is_opening:
-                    result += chr(8217)  # Right single quote '
-                    if quote_stack and quote_stack[-1] == 'single':
-                        quote_stack.pop()
                 else:
-                    # Use stack to decide
-                    if not quote_stack or quote_stack[-1] != 'single':
-                        result += chr(8216)  # Left single quote '
-                        quote_stack.append('single')
-                    else:
-                        result += chr(8217)  # Right single quote '
-                        quote_stack.pop()
-        else:
-            result += char
+                    result.append(chr(8217))  # Right single quote '
+                    quote_stack.pop()
         
-        i += 1
+        result.append(after)
+    
+    return ''.join(result)
+
+
+# Old Testament books, lowercased
+_OLD_TESTAMENT_BOOKS = frozenset({
+    # Torah/Pentateuch
+    'genesis', 'exodus', 'leviticus', 'numbers', 'deuteronomy',
     
-    return result
+    # Historical Books
+    'joshua', 'judges', 'ruth', '1 samuel', '2 samuel', '1 kings', '2 kings',
+    '1 chronicles', '2 chronicles', 'ezra', 'nehemiah', 'esther',
+    
+    # Wisdom Literature
+    'job', 'psalms', 'psalm', 'proverbs', 'ecclesiastes', 'song of solomon', 'song of songs',
+    
+    # Major Prophets
+    'isaiah', 'jeremiah', 'lamentations', 'ezekiel', 'daniel',
+    
+    # Minor Prophets
+    'hosea', 'joel', 'amos', 'obadiah', 'jonah', 'micah', 'nahum', 'habakkuk',
+    'zephaniah', 'haggai', 'zechariah', 'malachi'
+})
+
+# Old Testament books as normalize_book_name spells them, checked before lowercasing
+_OLD_TESTAMENT_BOOK_NAMES = frozenset(
+    name for name in _BOOK_LOOKUP.values() if name.lower() in _OLD_TESTAMENT_BOOKS
+)
 
 
+@lru_cache(maxsize=256)
 def is_old_testament_book(book: str) -> bool:
     """
     Determine if a Bible book is from the Old Testament.
@@ -433,29 +567,13 @@ def is_old_testament_book(book: str) -> bool:
     if not book:
         return False
     
-    book_lower = book.lower().strip()
+    # Canonical names need no lowercasing or stripping
+    if book in _OLD_TESTAMENT_BOOK_NAMES:
+        return True
     
-    # Old Testament books
-    old_testament_books = {
-        # Torah/Pentateuch
-        'genesis', 'exodus', 'leviticus', 'numbers', 'deuteronomy',
-        
-        # Historical Books
-        'joshua', 'judges', 'ruth', '1 samuel', '2 samuel', '1 kings', '2 kings',
-        '1 chronicles', '2 chronicles', 'ezra', 'nehemiah', 'esther',
-        
-        # Wisdom Literature
-        'job', 'psalms', 'psalm', 'proverbs', 'ecclesiastes', 'song of solomon', 'song of songs',
-        
-        # Major Prophets
-        'isaiah', 'jeremiah', 'lamentations', 'ezekiel', 'daniel',
-        
-        # Minor Prophets
-        'hosea', 'joel', 'amos', 'obadiah', 'jonah', 'micah', 'nahum', 'habakkuk',
-        'zephaniah', 'haggai', 'zechariah', 'malachi'
-    }
+    book_lower = book.lower().strip()
     
-    return book_lower in old_testament_books
+    return book_lower in _OLD_TESTAMENT_BOOKS
 
 
 def apply_yhwh_typography(text: str, book: str = None, use_html: bool = False) -> str:
@@ -483,50 +601,13 @@ def apply_yhwh_typography(text: str, book: str = None, use_html: bool = False) -
     if book and not is_old_testament_book(book):
         return text
     
-    # Define YHWH patterns - these represent the tetragrammaton YHWH
-    # Most English translations render YHWH as "LORD" in small caps
-    # Use case-insensitive patterns with capture groups to preserve original case
-    yhwh_patterns = [
-        # Primary patterns (99.9% of cases) - preserve case of "the/The"
-        (r'\b(the|The) Lord\b', r'\1 L{small_caps}ORD{/small_caps}'),
-        (r'\b(O|o) Lord\b', r'\1 L{small_caps}ORD{/small_caps}'),
-        
-        # Complex compound patterns
-        (r'\b(the|The) Lord God\b', r'\1 L{small_caps}ORD{/small_caps} God'),
-        (r'\b(O|o) Lord God\b', r'\1 L{small_caps}ORD{/small_caps} God'),
-        (r'\bLord God\b', 'L{small_caps}ORD{/small_caps} God'),
-        
-        # Additional YHWH compound names
-        (r'\b(the|The) Lord of hosts\b', r'\1 L{small_caps}ORD{/small_caps} of hosts'),
-        (r'\b(O|o) Lord of hosts\b', r'\1 L{small_caps}ORD{/small_caps} of hosts'),
-        (r'\bLord of hosts\b', 'L{small_caps}ORD{/small_caps} of hosts'),
-        
-        # YHWH with possessive
-        (r'\b(the|The) Lord\'s\b', r'\1 L{small_caps}ORD{/small_caps}\'s'),
-        (r'\bLord\'s\b', 'L{small_caps}ORD{/small_caps}\'s'),
-        
-        # Standalone Lord at sentence beginning (likely YHWH in most contexts)
-        (r'^Lord\b', 'L{small_caps}ORD{/small_caps}'),
-        (r'(?<=\. )Lord\b', 'L{small_caps}ORD{/small_caps}'),
-        (r'(?<=\! )Lord\b', 'L{small_caps}ORD{/small_caps}'),
-        (r'(?<=\? )Lord\b', 'L{small_caps}ORD{/small_caps}'),
-    ]
+    # Every pattern needs a literal "Lord", so most verses can skip the scans
+    if 'Lord' not in text:
+        return text
     
     # Apply patterns (now with case preservation through capture groups)
-    for pattern, replacement in yhwh_patterns:
-        if use_html:
-            # Use HTML markup for web display
-            html_replacement = replacement.replace(
-                '{small_caps}', '<span class="small-caps">'
-            ).replace('{/small_caps}', '</span>')
-            text = re.sub(pattern, html_replacement, text)
-        else:
-            # Use Unicode small caps characters for plain text
-            # Unicode small caps: ᴀʙᴄᴅᴇꜰɢʜɪᴊᴋʟᴍɴᴏᴘǫʀꜱᴛᴜᴠᴡxʏᴢ
-            small_caps_replacement = replacement.replace(
-                '{small_caps}ORD{/small_caps}', 'ᴏʀᴅ'
-            )
-            text = re.sub(pattern, small_caps_replacement, text)
+    for pattern, replacement in (_YHWH_HTML_SUBS if use_html else _YHWH_PLAIN_SUBS):
+        text = pattern.sub(replacement, text)
     
     return text
 
@@ -553,20 +634,26 @@ def extract_verses_from_text(text: str, book: str, chapter: int, start_verse: in
     # Normalize the text first
     text = text.strip()
     
-    # Try multiple verse number patterns to handle different formats
-    verse_patterns = [
-        r'(\d+)\s+([^0-9]+?)(?=\s*\d+\s+|$)',  # "1 Text here 2 More text"
-        r'(\d+)\.\s*([^0-9]+?)(?=\s*\d+\.|$)',  # "1. Text here 2. More text"
-        r'(\d+):\s*([^0-9]+?)(?=\s*\d+:|$)',   # "1: Text here 2: More text"
-    ]
+    # Every verse gets the same normalized book name
+    canonical_book = normalize_book_name(book)
     
+    # Try multiple verse number patterns to handle different formats
     verses_found = False
     
-    for pattern in verse_patterns:
-        matches = re.findall(pattern, text, re.DOTALL)
+    # Count the separators after digits in one scan, so that a pattern is only
+    # tried when its verse numbers could occur at least twice
+    separators = Counter(
+        separator if separator in '.:' else ' '
+        for separator in _VERSE_SEPARATOR_RE.findall(text)
+    )
+    
+    for pattern, separator in _VERSE_PATTERNS:
+        if separators[separator] < 2:
+            continue
+        matches = pattern.findall(text)
         if matches and len(matches) > 1:  # Only use if we find multiple verses
             verses_found = True
-            print(f"Found {len(matches)} verses using pattern: {pattern}")
+            logger.debug("Found %d verses using pattern: %s", len(matches), pattern.pattern)
             
             for verse_num_str, verse_text in matches:
                 try:
@@ -575,7 +662,7 @@ def extract_verses_from_text(text: str, book: str, chapter: int, start_verse: in
                     
                     if cleaned_text and len(cleaned_text) > 10:  # Filter out very short text
                         verses.append(BibleVerse(
-                            book=normalize_book_name(book),
+                            book=canonical_book,
                             chapter=chapter,
                             verse=verse_num,
                             text=cleaned_text
@@ -594,7 +681,7 @@ def extract_verses_from_text(text: str, book: str, chapter: int, start_verse: in
         
         for line in lines:
             # Look for lines that start with a number
-            match = re.match(r'^(\d+)\s+(.+)', line)
+            match = _NUMBERED_LINE_RE.match(line)
             if match:
                 verse_num_str, verse_text = match.groups()
                 try:
@@ -603,7 +690,7 @@ def extract_verses_from_text(text: str, book: str, chapter: int, start_verse: in
                     
                     if cleaned_text and len(cleaned_text) > 10:
                         verses.append(BibleVerse(
-                            book=normalize_book_name(book),
+                            book=canonical_book,
                             chapter=chapter,
                             verse=verse_num,
                             text=cleaned_text
@@ -620,7 +707,7 @@ def extract_verses_from_text(text: str, book: str, chapter: int, start_verse: in
     # Look for any numbers in the text that could be verse numbers
     if not verses_found:
         # Split by any standalone numbers
-        parts = re.split(r'\s+(\d+)\s+', text)
+        parts = _STANDALONE_NUMBER_RE.split(text)
         
         if len(parts) > 2:  # We have at least one number split
             current_verse_num = start_verse
@@ -646,7 +733,7 @@ def extract_verses_from_text(text: str, book: str, chapter: int, start_verse: in
                         cleaned_text = clean_verse_text(verse_text, book)
                         if cleaned_text and len(cleaned_text) > 10:
                             verses.append(BibleVerse(
-                                book=normalize_book_name(book),
+                                book=canonical_book,
                                 chapter=chapter,
                                 verse=current_verse_num,
                                 text=cleaned_text
@@ -662,39 +749,35 @@ def extract_verses_from_text(text: str, book: str, chapter: int, start_verse: in
         # If we have an end_verse hint, try to split the text intelligently
         if end_verse and end_verse > start_verse:
             # Try to split by sentences or natural breaks
-            sentences = re.split(r'[.!?]+\s+', cleaned_text)
+            sentences = _SENTENCE_BREAK_RE.split(cleaned_text)
             verses_needed = end_verse - start_verse + 1
             
-            if len(sentences) >= verses_needed:
+            sentence_count = len(sentences)
+            if sentence_count >= verses_needed:
                 # Distribute sentences among verses
-                sentences_per_verse = max(1, len(sentences) // verses_needed)
+                sentences_per_verse = max(1, sentence_count // verses_needed)
                 
-                sentence_idx = 0
-                for verse_num in range(start_verse, end_verse + 1):
-                    if sentence_idx >= len(sentences):
-                        break
-                    
-                    # Take a reasonable number of sentences for this verse
-                    end_idx = min(sentence_idx + sentences_per_verse, len(sentences))
-                    verse_sentences = sentences[sentence_idx:end_idx]
+                # Each verse takes the next run of sentences until they run out
+                verse_starts = range(0, sentence_count, sentences_per_verse)
+                for verse_num, sentence_idx in zip(range(start_verse, end_verse + 1), verse_starts):
+                    # A lone sentence needs no join
+                    if sentences_per_verse == 1:
+                        verse_text = sentences[sentence_idx]
+                    else:
+                        verse_text = '. '.join(sentences[sentence_idx:sentence_idx + sentences_per_verse])
+                    if not verse_text.endswith('.'):
+                        verse_text += '.'
                     
-                    if verse_sentences:
-                        verse_text = '. '.join(verse_sentences)
-                        if not verse_text.endswith('.'):
-                            verse_text += '.'
-                        
-                        verses.append(BibleVerse(
-                            book=normalize_book_name(book),
-                            chapter=chapter,
-                            verse=verse_num,
-                            text=verse_text.strip()
-                        ))
-                        
-                        sentence_idx = end_idx
+                    verses.append(BibleVerse(
+                        book=canonical_book,
+                        chapter=chapter,
+                        verse=verse_num,
+                        text=verse_text.strip()
+                    ))
             else:
                 # Not enough sentences to split meaningfully, create single verse
                 verses.append(BibleVerse(
-                    book=normalize_book_name(book),
+                    book=canonical_book,
                     chapter=chapter,
                     verse=start_verse,
                     text=cleaned_text
@@ -702,7 +785,7 @@ def extract_verses_from_text(text: str, book: str, chapter: int, start_verse: in
         else:
             # Single verse or unknown range
             verses.append(BibleVerse(
-                book=normalize_book_name(book),
+                book=canonical_book,
                 chapter=chapter,
                 verse=start_verse,
                 text=cleaned_text
@@ -732,61 +815,78 @@ def parse_bible_text(raw_text: str, reference: str, version: str = "NKJV") -> Bi
         >>> len(passage.verses)
         2
     """
+    passage, error = _build_bible_passage(raw_text, reference, version)
+    if passage is None:
+        raise ValueError(error)
+    return passage
+
+
+def try_parse_bible_text(raw_text: str, reference: str, version: str = "NKJV") -> Optional[BiblePassage]:
+    """
+    Parse raw Bible text like parse_bible_text, returning None instead of raising.
+    
+    Args:
+        raw_text: Raw Bible text from web scraping or other sources
+        reference: Bible reference string (e.g., "Luke 1:1-38")
+        version: Bible version (default: "NKJV")
+        
+    Returns:
+        BiblePassage object with structured verses, or None if the reference
+        cannot be parsed or no verses can be extracted
+    """
+    return _build_bible_passage(raw_text, reference, version)[0]
+
+
+def _build_bible_passage(raw_text: str, reference: str, version: str) -> Tuple[Optional[BiblePassage], Optional[str]]:
+    """Build a passage, returning (None, reason) for input that cannot be parsed."""
     if not raw_text or not raw_text.strip():
-        raise ValueError("Raw text cannot be empty")
+        return None, "Raw text cannot be empty"
     
     if not reference or not reference.strip():
-        raise ValueError("Reference cannot be empty")
+        return None, "Reference cannot be empty"
     
     # Parse the reference
-    try:
-        book, chapter, start_verse, end_verse = parse_bible_reference(reference)
-    except ValueError as e:
-        raise ValueError(f"Invalid Bible reference '{reference}': {e}")
+    parsed = _parse_reference(reference)
+    if parsed is None:
+        return None, (f"Invalid Bible reference '{reference}': "
+                      f"Could not parse Bible reference: {reference.strip()}")
+    book = parsed.book
     
     # Handle cross-chapter ranges (like "Zechariah 12:1-13:1")
-    if '-' in reference and ':' in reference:
-        # Check if this is a cross-chapter range
-        cross_chapter_match = re.match(r'(\d?\s*[A-Za-z]+)\s+(\d+):(\d+)-(\d+):(\d+)', reference)
-        if cross_chapter_match:
-            # This is a complex cross-chapter range
-            # For now, we'll parse it as starting from the first chapter/verse
-            # The actual implementation would need to handle fetching multiple chapters
-            book = cross_chapter_match.group(1).strip()
-            start_chapter = int(cross_chapter_match.group(2))
-            start_verse_num = int(cross_chapter_match.group(3))
-            end_chapter = int(cross_chapter_match.group(4))
-            end_verse_num = int(cross_chapter_match.group(5))
-            
-            # For this implementation, we'll create verses assuming the text contains
-            # verses from multiple chapters in sequence
-            verses = []
-            
-            # Split the text and try to identify chapter boundaries
-            # This is a simplified approach - real implementation might need more sophisticated parsing
-            cleaned_text = clean_verse_text(raw_text, book)
-            
-            # Create a single verse for now (this would need enhancement for real cross-chapter parsing)
-            verses.append(BibleVerse(
-                book=normalize_book_name(book),
-                chapter=start_chapter,
-                verse=start_verse_num,
-                text=cleaned_text
-            ))
-            
-            return BiblePassage(
-                reference=reference,
-                version=version,
-                verses=verses,
-                highlights=[],
-                fetched_at=datetime.now()
-            )
+    if parsed.end_chapter is not None:
+        # This is a complex cross-chapter range
+        # For now, we'll parse it as starting from the first chapter/verse
+        # The actual implementation would need to handle fetching multiple chapters
+        
+        # For this implementation, we'll create verses assuming the text contains
+        # verses from multiple chapters in sequence
+        verses = []
+        
+        # Split the text and try to identify chapter boundaries
+        # This is a simplified approach - real implementation might need more sophisticated parsing
+        cleaned_text = clean_verse_text(raw_text, book)
+        
+        # Create a single verse for now (this would need enhancement for real cross-chapter parsing)
+        verses.append(BibleVerse(
+            book=normalize_book_name(book),
+            chapter=parsed.start_chapter,
+            verse=parsed.start_verse,
+            text=cleaned_text
+        ))
+        
+        return BiblePassage(
+            reference=reference,
+            version=version,
+            verses=verses,
+            highlights=[],
+            fetched_at=datetime.now()
+        ), None
     
     # Extract verses from the text
-    verses = extract_verses_from_text(raw_text, book, chapter, start_verse, end_verse)
+    verses = extract_verses_from_text(raw_text, book, parsed.start_chapter, parsed.start_verse, parsed.end_verse)
     
     if not verses:
-        raise ValueError(f"No verses could be extracted from text for reference '{reference}'")
+        return None, f"No verses could be extracted from text for reference '{reference}'"
     
     # Create and return the passage
     return BiblePassage(
@@ -795,7 +895,43 @@ def parse_bible_text(raw_text: str, reference: str, version: str = "NKJV") -> Bi
         verses=verses,
         highlights=[],
         fetched_at=datetime.now()
-    )
+    ), None
+
+
+def _parse_passage_with_fallback(reference: str, text: str, version: str) -> Optional[BiblePassage]:
+    """Parse one passage, falling back to a single-verse passage holding the raw text."""
+    try:
+        passage, error = _build_bible_passage(text, reference, version)
+    except ValueError as e:
+        # Verse validation errors still surface as exceptions
+        passage, error = None, str(e)
+    if passage is not None:
+        return passage
+    
+    print(f"Warning: Could not parse passage '{reference}': {error}")
+    # Create a minimal passage with the raw text as a single verse
+    parsed = _parse_reference(reference)
+    if parsed is None:
+        print(f"Error: Could not create fallback passage for '{reference}'")
+        return None
+    try:
+        book = parsed.book
+        fallback_verse = BibleVerse(
+            book=normalize_book_name(book),
+            chapter=parsed.start_chapter,
+            verse=parsed.start_verse,
+            text=clean_verse_text(text, book) or "Text unavailable"
+        )
+        return BiblePassage(
+            reference=reference,
+            version=version,
+            verses=[fallback_verse],
+            highlights=[],
+            fetched_at=datetime.now()
+        )
+    except Exception:
+        print(f"Error: Could not create fallback passage for '{reference}'")
+        return None
 
 
 def parse_mcheyne_passage_list(passage_texts: Dict[str, str], version: str = "NKJV") -> Dict[str, List[BiblePassage]]:
@@ -820,29 +956,11 @@ def parse_mcheyne_passage_list(passage_texts: Dict[str, str], version: str = "NK
     """
     parsed_passages = {}
     
+    # Passages are independent, but parsing is pure-Python work that holds the
+    # GIL, so a thread pool would only add overhead; parse them in order
     for reference, text in passage_texts.items():
-        try:
-            passage = parse_bible_text(text, reference, version)
+        passage = _parse_passage_with_fallback(reference, text, version)
+        if passage is not None:
             parsed_passages[reference] = passage
-        except ValueError as e:
-            print(f"Warning: Could not parse passage '{reference}': {e}")
-            # Create a minimal passage with the raw text as a single verse
-            try:
-                book, chapter, start_verse, _ = parse_bible_reference(reference)
-                fallback_verse = BibleVerse(
-                    book=normalize_book_name(book),
-                    chapter=chapter,
-                    verse=start_verse,
-                    text=clean_verse_text(text, book) or "Text unavailable"
-                )
-                parsed_passages[reference] = BiblePassage(
-                    reference=reference,
-                    version=version,
-                    verses=[fallback_verse],
-                    highlights=[],
-                    fetched_at=datetime.now()
-                )
-            except Exception:
-                print(f"Error: Could not create fallback passage for '{reference}'")
     
     return parsed_passages
\ No newline at end of file
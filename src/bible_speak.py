@@ -1,47 +1,12 @@
-import streamlit as st
-
-
-
-
-def refresh_speak_html():
-    """
-    Build Play / Pause / Resume / Stop buttons.
-    Uses the best available male voice on every platform.
-    """
-    # ------------------------------------------------------------------
-    # 1. Escape back-ticks for JS template literals
-    # ------------------------------------------------------------------
-    raw = st.session_state.full_text.replace("`", "\\`")
+import html
+import json
 
-    # ------------------------------------------------------------------
-    # 2. Split into chunks + pause markers
-    # ------------------------------------------------------------------
-    import re
-    parts = []
-    pos = 0
-    for m in re.finditer(r"{{pause\s+(\d+)}}", raw):
-        if m.start() > pos:
-            parts.append((raw[pos:m.start()].strip(), None))
-        parts.append(("", int(m.group(1))))
-        pos = m.end()
-    if pos < len(raw):
-        parts.append((raw[pos:].strip(), None))
-
-    # ------------------------------------------------------------------
-    # 3. Build JS array of chunks
-    # ------------------------------------------------------------------
-    js_chunks = []
-    for text, pause in parts:
-        if pause is not None:
-            js_chunks.append(f"{{pauseSec: {pause}}}")
-        elif text:
-            js_chunks.append(f"{{text: `{text}`}}")
-    chunks_array = "[" + ", ".join(js_chunks) + "]"
+import streamlit as st
+from bible_format import PAUSE_MARK
 
-    # ------------------------------------------------------------------
-    # 4. HTML + JS with robust male voice selection
-    # ------------------------------------------------------------------
-    speak_html = f"""
+# HTML + JS with robust male voice selection; __CHUNKS__ is replaced by the
+# JS array of text and pause chunks
+_SPEAK_TEMPLATE = """
 <script>
   // ---------- Global state ----------
   let isPaused = false;
@@ -52,11 +17,11 @@ def refresh_speak_html():
   let selectedVoice = null;
 
   // ---------- Voice selection (cross-platform, male-first) ----------
-  function getBestMaleVoice() {{
-    return new Promise((resolve) => {{
+  function getBestMaleVoice() {
+    return new Promise((resolve) => {
       let voices = window.speechSynthesis.getVoices();
 
-      const isMale = (v) => {{
+      const isMale = (v) => {
         const name = v.name.toLowerCase();
         const lang = v.lang.toLowerCase();
         return (
@@ -72,18 +37,18 @@ def refresh_speak_html():
           (name.includes('wavenet') && (name.includes('b') || name.includes('d'))) ||  // Google male: WaveNet-B/D
           name.includes('standard-b') || name.includes('standard-d')  // Chrome male standards
         );
-      }};
+      };
 
-      if (voices.length > 0) {{
+      if (voices.length > 0) {
         selectedVoice = voices.find(v => isMale(v) && v.lang.startsWith('en')) ||
                         voices.find(v => v.name === 'Alex' && v.lang === 'en-US') ||
                         voices.find(v => v.name === 'Daniel' && v.lang.startsWith('en')) ||
                         voices.find(v => v.lang.startsWith('en'));
         resolve(selectedVoice);
         return;
-      }}
+      }
 
-      const handler = () => {{
+      const handler = () => {
         voices = window.speechSynthesis.getVoices();
         selectedVoice = voices.find(v => isMale(v) && v.lang.startsWith('en')) ||
                         voices.find(v => v.name === 'Alex' && v.lang === 'en-US') ||
@@ -91,21 +56,21 @@ def refresh_speak_html():
                         voices.find(v => v.lang.startsWith('en'));
         window.speechSynthesis.removeEventListener('voiceschanged', handler);
         resolve(selectedVoice);
-      }};
+      };
       window.speechSynthesis.addEventListener('voiceschanged', handler);
-    }});
-  }}
+    });
+  }
 
   // ---------- Start ----------
-  async function speakNow(allChunks) {{
-    if (!('speechSynthesis' in window)) {{
+  async function speakNow(allChunks) {
+    if (!('speechSynthesis' in window)) {
       alert('Speech not supported');
       return;
-    }}
+    }
 
-    if (!selectedVoice) {{
+    if (!selectedVoice) {
       await getBestMaleVoice();
-    }}
+    }
 
     window.speechSynthesis.cancel();
     isPaused = false; isStopped = false;
@@ -113,64 +78,64 @@ def refresh_speak_html():
     chunks = allChunks;
     chunkIdx = 0;
     nextChunk();
-  }}
+  }
 
   // ---------- Process next chunk ----------
-  function nextChunk() {{
+  function nextChunk() {
     if (isStopped || chunkIdx >= chunks.length) return;
     if (isPaused) return;
 
     const chunk = chunks[chunkIdx++];
-    if ('pauseSec' in chunk) {{
+    if ('pauseSec' in chunk) {
       const start = Date.now();
-      const timer = setInterval(() => {{
-        if (Date.now() - start >= chunk.pauseSec * 1000) {{
+      const timer = setInterval(() => {
+        if (Date.now() - start >= chunk.pauseSec * 1000) {
           clearInterval(timer);
           nextChunk();
-        }}
-      }}, 50);
+        }
+      }, 50);
       const silent = new SpeechSynthesisUtterance('');
-      silent.onend = () => {{}};
+      silent.onend = () => {};
       window.speechSynthesis.speak(silent);
-    }} else {{
+    } else {
       const u = new SpeechSynthesisUtterance(chunk.text);
       u.lang = 'en-US';
       if (selectedVoice) u.voice = selectedVoice;
       currentUtt = u;
-      u.onend = () => {{ currentUtt = null; nextChunk(); }};
-      u.onerror = (e) => {{ console.error(e); nextChunk(); }};
+      u.onend = () => { currentUtt = null; nextChunk(); };
+      u.onerror = (e) => { console.error(e); nextChunk(); };
       window.speechSynthesis.speak(u);
-    }}
-  }}
+    }
+  }
 
   // ---------- Pause / Resume ----------
-  function togglePause() {{
+  function togglePause() {
     const btn = document.getElementById('pauseBtn');
     if (isStopped) return;
 
-    if (isPaused) {{
+    if (isPaused) {
       isPaused = false;
       btn.textContent = 'Pause';
       window.speechSynthesis.resume();
       nextChunk();
-    }} else {{
+    } else {
       isPaused = true;
       btn.textContent = 'Resume';
       window.speechSynthesis.pause();
-    }}
-  }}
+    }
+  }
 
   // ---------- Stop ----------
-  function stopSpeech() {{
+  function stopSpeech() {
     window.speechSynthesis.cancel();
     isStopped = true;
     isPaused = false;
     const btn = document.getElementById('pauseBtn');
     if (btn) btn.textContent = 'Pause';
-  }}
+  }
 </script>
 
-<button onclick="speakNow({chunks_array})"
+<button onclick="speakNow(__CHUNKS__)"
     style="padding:12px 20px; font-size:16px; background:#0066cc; color:white;
            border:none; border-radius:8px; cursor:pointer; font-weight:bold; margin-right:8px;">
   Play
@@ -188,4 +153,41 @@ def refresh_speak_html():
   Stop
 </button>
 """
-    st.session_state.speak_html = speak_html
\ No newline at end of file
+
+
+def refresh_speak_html():
+    """
+    Build Play / Pause / Resume / Stop buttons.
+    Uses the best available male voice on every platform.
+    """
+    # The player depends only on full_text, so reruns with unchanged text
+    # keep the HTML already built
+    ss = st.session_state
+    full_text = ss.full_text
+    if ss.get('_speak_html_text') == full_text and 'speak_html' in ss:
+        return
+
+    # ------------------------------------------------------------------
+    # 1. Split into chunks + pause markers
+    #    Tokens alternate: text, pause seconds, text, pause seconds, ...
+    # ------------------------------------------------------------------
+    chunks = []
+    for i, tok in enumerate(full_text.split(PAUSE_MARK)):
+        if i & 1:
+            chunks.append({"pauseSec": int(tok)})
+        else:
+            tok = tok.strip()
+            if tok:
+                chunks.append({"text": tok})
+
+    # ------------------------------------------------------------------
+    # 2. Serialize the chunks as a JS array (JSON is valid JS), escaped
+    #    for the double-quoted onclick attribute
+    # ------------------------------------------------------------------
+    chunks_array = html.escape(json.dumps(chunks))
+
+    # ------------------------------------------------------------------
+    # 3. Fill the chunks into the player HTML
+    # ------------------------------------------------------------------
+    ss.speak_html = _SPEAK_TEMPLATE.replace("__CHUNKS__", chunks_array)
+    ss._speak_html_text = full_text
@@ -6,7 +6,7 @@ This script shows how to use the new JSON serialization features.
 """
 
 import json
-from datetime import datetime
+import time
 from .bible_models import BiblePassage, BibleVerse, BibleHighlight, HighlightPosition
 from .mccheyne import McCheyneReader
 
@@ -222,16 +222,16 @@ def demo_performance():
     print(f"   Highlights: {len(large_passage.highlights)}")
     
     print(f"\n2. Serialization performance:")
-    start_time = datetime.now()
+    start_time = time.perf_counter_ns()
     json_str = large_passage.to_json()
-    serialize_time = (datetime.now() - start_time).total_seconds()
+    serialize_time = (time.perf_counter_ns() - start_time) / 1e9
     print(f"   Serialization time: {serialize_time:.4f} seconds")
     print(f"   JSON size: {len(json_str):,} characters")
     
     print(f"\n3. Deserialization performance:")
-    start_time = datetime.now()
+    start_time = time.perf_counter_ns()
     restored_passage = BiblePassage.from_json(json_str)
-    deserialize_time = (datetime.now() - start_time).total_seconds()
+    deserialize_time = (time.perf_counter_ns() - start_time) / 1e9
     print(f"   Deserialization time: {deserialize_time:.4f} seconds")
     print(f"   Restored verses: {restored_passage.total_verses}")
     print(f"   Restored highlights: {len(restored_passage.highlights)}")
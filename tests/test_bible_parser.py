@@ -12,6 +12,7 @@ from src.bible_parser import (
     clean_verse_text,
     extract_verses_from_text,
     parse_bible_text,
+    try_parse_bible_text,
     parse_mcheyne_passage_list
 )
 from src.bible_models import BibleVerse, BiblePassage
@@ -264,6 +265,16 @@ class TestParseBibleText:
         assert passage.total_verses == 1
         assert passage.total_words > 0
         assert passage.books == ["John"]
+    
+    def test_try_parse_returns_none_on_bad_input(self):
+        """Test that try_parse_bible_text returns None instead of raising."""
+        assert try_parse_bible_text("", "John 3:16") is None
+        assert try_parse_bible_text("Some text", "") is None
+        assert try_parse_bible_text("Some text", "Invalid Reference") is None
+        
+        passage = try_parse_bible_text("For God so loved the world...", "John 3:16")
+        assert passage is not None
+        assert passage.total_verses == 1
 
 
 class TestParseMcheynePassageList:
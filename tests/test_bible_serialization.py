@@ -157,7 +157,18 @@ class TestBibleModelsSerialization(unittest.TestCase):
         restored_from_dict = BiblePassage.from_dict(data_dict)
         self.assertEqual(restored_from_dict.reference, self.sample_passage.reference)
         self.assertEqual(len(restored_from_dict.verses), len(self.sample_passage.verses))
-    
+
+    def test_bible_passage_trusted_round_trip(self):
+        """Test BiblePassage.from_dict_trusted rebuilds an equal passage without validation."""
+        data_dict = json.loads(self.sample_passage.to_json())
+
+        restored = BiblePassage.from_dict_trusted(data_dict)
+        self.assertEqual(restored, self.sample_passage)
+        self.assertIsInstance(restored.fetched_at, datetime)
+        self.assertIsInstance(restored.verses[0], BibleVerse)
+        self.assertIsInstance(restored.highlights[0].start_position, HighlightPosition)
+        self.assertEqual(restored.total_words, self.sample_passage.total_words)
+
     def test_bible_passage_file_operations(self):
         """Test BiblePassage file save/load operations."""
         with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as temp_file:
@@ -153,6 +153,20 @@ class TestBibleVerseProperties:
         
         verse3 = BibleVerse(book="Psalms", chapter=119, verse=105, text="Your word is a lamp")
         assert verse3.reference == "Psalms 119:105"
+    
+    def test_properties_follow_field_changes(self):
+        """Test that cached properties are recomputed after a field is reassigned."""
+        verse = BibleVerse(book="John", chapter=3, verse=16, text="For God so loved")
+        assert verse.word_count == 4
+        assert verse.reference == "John 3:16"
+        
+        verse.text = "For God so loved the world"
+        verse.verse = 17
+        
+        assert verse.word_count == 6
+        assert verse.char_count == len("For God so loved the world")
+        assert verse.get_words()[-1] == "world"
+        assert verse.reference == "John 3:17"
 
 
 class TestBibleVerseMethods:
@@ -328,6 +328,14 @@ class TestBiblePassageDisplay(unittest.TestCase):
         # Should include coverage statistics
         self.assertIn("Total coverage:", result)
     
+    def test_format_highlights_summary_limit(self):
+        """Test that a limit lists only the most popular highlights."""
+        result = self.passage.format_highlights_summary(limit=1)
+        
+        self.assertIn("2 total", result)
+        self.assertIn("100 users", result)
+        self.assertNotIn("50 users", result)
+    
     def test_format_highlights_summary_no_highlights(self):
         """Test highlights summary with no highlights."""
         passage_no_highlights = BiblePassage(
@@ -84,6 +84,36 @@ class TestHighlightManagement:
                 HighlightPosition(verse_index=0, word_index=100),
                 HighlightPosition(verse_index=0, word_index=102)
             )
+        
+        # End before start
+        with pytest.raises(ValueError, match="End position must be after or equal to start position"):
+            sample_passage.add_highlight(
+                HighlightPosition(verse_index=1, word_index=0),
+                HighlightPosition(verse_index=0, word_index=2)
+            )
+        assert sample_passage.highlights == []
+    
+    def test_add_highlights_bulk(self, sample_passage):
+        """Test bulk adding aggregates repeated highlights into counts."""
+        first = (HighlightPosition(verse_index=0, word_index=0), HighlightPosition(verse_index=0, word_index=2))
+        second = (HighlightPosition(verse_index=1, word_index=0), HighlightPosition(verse_index=2, word_index=1))
+        existing = sample_passage.add_highlight(*first)
+        
+        created = sample_passage.add_highlights_bulk([first, second, first, second, second])
+        
+        assert created == 1
+        assert len(sample_passage.highlights) == 2
+        assert existing.highlight_count == 3
+        assert sample_passage.highlights[1].highlight_count == 3
+        assert len(sample_passage.get_highlights_by_verse(2)) == 1
+        
+        # Nothing is added if any event is invalid
+        with pytest.raises(ValueError, match="beyond verse length"):
+            sample_passage.add_highlights_bulk([
+                first,
+                (HighlightPosition(verse_index=0, word_index=100), HighlightPosition(verse_index=0, word_index=101))
+            ])
+        assert existing.highlight_count == 3
     
     def test_merge_overlapping_highlights(self, sample_passage):
         """Test merging of overlapping highlights."""
@@ -126,6 +156,23 @@ class TestHighlightManagement:
         assert merged.start_position == HighlightPosition(verse_index=0, word_index=0)
         assert merged.end_position == HighlightPosition(verse_index=0, word_index=5)
     
+    def test_merge_leaves_disjoint_sorted_highlights_alone(self, sample_passage):
+        """Test that an already tidy highlight list is not rebuilt by merging."""
+        sample_passage.add_highlight(
+            HighlightPosition(verse_index=0, word_index=0),
+            HighlightPosition(verse_index=0, word_index=2)
+        )
+        sample_passage.add_highlight(
+            HighlightPosition(verse_index=0, word_index=4),
+            HighlightPosition(verse_index=1, word_index=1)
+        )
+        highlights = sample_passage.highlights
+        
+        sample_passage.merge_overlapping_highlights()
+        
+        assert sample_passage.highlights is highlights
+        assert len(highlights) == 2
+    
     def test_get_popular_highlights(self, sample_passage):
         """Test getting highlights sorted by popularity."""
         # Add highlights with different counts
@@ -151,6 +198,10 @@ class TestHighlightManagement:
         popular_filtered = sample_passage.get_popular_highlights(min_count=8)
         assert len(popular_filtered) == 1
         assert popular_filtered[0].highlight_count == 10
+        
+        # Top-k selection matches the head of the full ordering
+        assert sample_passage.get_popular_highlights(limit=1) == [h2]
+        assert sample_passage.get_popular_highlights(limit=5) == popular
     
     def test_search_highlights_by_text(self, sample_passage):
         """Test searching highlights by text content."""
@@ -174,7 +225,24 @@ class TestHighlightManagement:
         # Case insensitive search
         results = sample_passage.search_highlights(text_query="GOD")
         assert len(results) == 2
-    
+
+    def test_search_highlights_by_text_after_changes(self, sample_passage):
+        """Test text search sees highlights added or removed after an earlier search."""
+        start_pos = HighlightPosition(verse_index=0, word_index=0)
+        end_pos = HighlightPosition(verse_index=0, word_index=4)
+        sample_passage.add_highlight(start_pos, end_pos)
+        assert len(sample_passage.search_highlights(text_query="lov")) == 1
+
+        sample_passage.add_highlight(
+            HighlightPosition(verse_index=2, word_index=0),
+            HighlightPosition(verse_index=2, word_index=3)  # "He who believes in"
+        )
+        assert len(sample_passage.search_highlights(text_query="believes in")) == 1
+        assert sample_passage.search_highlights(text_query="loved the world") == []
+
+        sample_passage.remove_highlight(start_pos, end_pos)
+        assert sample_passage.search_highlights(text_query="lov") == []
+
     def test_search_highlights_by_count(self, sample_passage):
         """Test searching highlights by minimum count."""
         h1 = sample_passage.add_highlight(
@@ -283,6 +351,22 @@ class TestHighlightManagement:
         removed = sample_passage.remove_highlight(start_pos, end_pos)
         assert removed is False
     
+    def test_remove_highlights_bulk(self, sample_passage):
+        """Test removing several highlights at once."""
+        keys = [
+            (HighlightPosition(verse_index=0, word_index=0), HighlightPosition(verse_index=0, word_index=2)),
+            (HighlightPosition(verse_index=1, word_index=0), HighlightPosition(verse_index=1, word_index=2)),
+            (HighlightPosition(verse_index=2, word_index=0), HighlightPosition(verse_index=2, word_index=2)),
+        ]
+        for start_pos, end_pos in keys:
+            sample_passage.add_highlight(start_pos, end_pos)
+        
+        removed = sample_passage.remove_highlights([keys[0], keys[2], keys[0]])
+        assert removed == 2
+        assert [(h.start_position, h.end_position) for h in sample_passage.highlights] == [keys[1]]
+        assert sample_passage.get_highlights_by_verse(0) == []
+        assert sample_passage.remove_highlights([keys[0]]) == 0
+    
     def test_clear_highlights(self, sample_passage):
         """Test clearing all highlights."""
         # Add multiple highlights
@@ -349,6 +433,24 @@ class TestHighlightManagement:
         expected_coverage = (3 / total_words) * 100.0
         assert abs(coverage - expected_coverage) < 0.01
     
+    def test_highlight_replaced_in_place(self, sample_passage):
+        """Test that replacing a highlight directly in the list refreshes cached results."""
+        sample_passage.add_highlight(
+            HighlightPosition(verse_index=0, word_index=0),
+            HighlightPosition(verse_index=0, word_index=2)
+        )
+        assert sample_passage.get_highlights_by_verse(2) == []
+        
+        last_verse = len(sample_passage.verses[2].words) - 1
+        sample_passage.highlights[0] = BibleHighlight(
+            start_position=HighlightPosition(verse_index=0, word_index=0),
+            end_position=HighlightPosition(verse_index=2, word_index=last_verse)
+        )
+        
+        assert sample_passage.get_highlight_coverage() == 100.0
+        assert sample_passage.get_highlight_coverage_optimized() == 100.0
+        assert sample_passage.get_highlights_by_verse(2) == [sample_passage.highlights[0]]
+    
     def test_highlight_edge_cases(self, sample_passage):
         """Test edge cases in highlight management."""
         # Single word highlight
@@ -419,6 +521,20 @@ class TestHighlightValidation:
         with pytest.raises(ValueError):
             HighlightPosition(verse_index=0, word_index=-1)
     
+    def test_highlight_position_key_orders_like_indices(self):
+        """Test the packed integer key sorts the same as (verse_index, word_index)."""
+        positions = [
+            HighlightPosition(verse_index=2, word_index=0),
+            HighlightPosition(verse_index=0, word_index=7),
+            HighlightPosition(verse_index=1, word_index=3),
+            HighlightPosition(verse_index=0, word_index=8),
+        ]
+        assert sorted(positions, key=lambda p: p.key) == sorted(positions)
+        assert hash(HighlightPosition(1, 3)) == hash(positions[2])
+        
+        with pytest.raises(ValueError):
+            HighlightPosition(verse_index=0, word_index=1 << 32)
+    
     def test_bible_highlight_validation(self):
         """Test BibleHighlight validation."""
         start_pos = HighlightPosition(verse_index=0, word_index=0)
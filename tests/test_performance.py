@@ -6,11 +6,12 @@ to ensure they meet the requirement of completing within 100ms for typical opera
 """
 
 import pytest
+import threading
 import time
 from typing import List
 from src.bible_models import (
     BibleVerse, BiblePassage, BibleHighlight, HighlightPosition,
-    PerformanceMonitor, _global_cache
+    PerformanceMonitor, CacheManager, _global_cache
 )
 
 
@@ -189,10 +190,28 @@ class TestPerformanceRequirements:
         _, memory_time = self.time_operation(passage.get_memory_usage)
         assert memory_time < 10, f"Memory usage calculation took {memory_time:.2f}ms"
         
-        # Test system memory monitoring
+        # Test system memory monitoring; the first call pays for the lazy psutil import
+        PerformanceMonitor.get_memory_usage()
         _, system_memory_time = self.time_operation(PerformanceMonitor.get_memory_usage)
         assert system_memory_time < 50, f"System memory monitoring took {system_memory_time:.2f}ms"
     
+    def test_time_function_records_slow_calls(self):
+        """Test that sampled slow calls are recorded instead of printed."""
+        PerformanceMonitor.drain_slow_calls()
+        
+        @PerformanceMonitor.time_function
+        def slow_operation():
+            time.sleep(0.11)
+            return "done"
+        
+        assert slow_operation() == "done"  # First call is always sampled
+        assert slow_operation() == "done"  # Second call is not
+        
+        slow_calls = PerformanceMonitor.drain_slow_calls()
+        assert [name for name, _ in slow_calls] == ["slow_operation"]
+        assert slow_calls[0][1] > 100
+        assert PerformanceMonitor.drain_slow_calls() == []
+    
     def test_cache_invalidation_performance(self):
         """Test that cache invalidation is fast."""
         passage = self.large_passage
@@ -331,8 +350,7 @@ class TestCacheEffectiveness:
         word_count1 = verse.word_count
         
         # Verify cache exists
-        assert hasattr(verse, '_cached_word_count')
-        assert getattr(verse, '_cached_word_count') == word_count1
+        assert verse.__dict__['word_count'] == word_count1
         
         # Second access should use cache
         word_count2 = verse.word_count
@@ -340,7 +358,7 @@ class TestCacheEffectiveness:
         
         # Test cache invalidation
         verse.invalidate_cache('word_count')
-        assert not hasattr(verse, '_cached_word_count')
+        assert 'word_count' not in verse.__dict__
     
     def test_lazy_property_caching(self):
         """Test that lazy properties work correctly."""
@@ -362,9 +380,8 @@ class TestCacheEffectiveness:
         # First access should compute and cache
         total_words1 = passage.total_words
         
-        # Verify lazy cache exists
-        assert hasattr(passage, '_lazy_total_words')
-        assert getattr(passage, '_lazy_total_words') == total_words1
+        # Verify the total was stored at construction
+        assert passage.__dict__['total_words'] == total_words1
         
         # Second access should use cache
         total_words2 = passage.total_words
@@ -372,7 +389,77 @@ class TestCacheEffectiveness:
         
         # Test cache invalidation
         passage.invalidate_cache('total_words')
-        assert not hasattr(passage, '_lazy_total_words')
+        assert 'total_words' not in passage.__dict__
+        assert passage.total_words == total_words1
+
+    def test_coverage_updated_incrementally(self):
+        """Test that adding a highlight updates cached coverage instead of dropping it."""
+        verses = [
+            BibleVerse(book="Psalms", chapter=23, verse=i + 1, text="one two three four five")
+            for i in range(4)
+        ]
+        passage = BiblePassage(reference="Psalms 23:1-4", version="NKJV", verses=verses)
+
+        passage.add_highlight(HighlightPosition(0, 0), HighlightPosition(0, 4))
+        assert passage.get_highlight_coverage_optimized() == 25.0
+
+        passage.add_highlight(HighlightPosition(0, 3), HighlightPosition(1, 1))
+        assert passage.__dict__['_covered_words'] == 7
+        assert passage.get_highlight_coverage_optimized() == 35.0
+
+        passage.remove_highlight(HighlightPosition(0, 0), HighlightPosition(0, 4))
+        assert '_covered_words' not in passage.__dict__
+        assert passage.get_highlight_coverage_optimized() == 20.0
+
+
+    def test_get_or_compute_runs_factory_once(self):
+        """Test that concurrent misses on one key compute the value only once."""
+        cache = CacheManager()
+        calls = []
+        
+        def factory():
+            calls.append(1)
+            time.sleep(0.01)
+            return "value"
+        
+        threads = [threading.Thread(target=cache.get_or_compute, args=("key", factory))
+                   for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        
+        assert len(calls) == 1
+        assert cache.get("key") == "value"
+        assert cache.get_or_compute("key", factory) == "value"
+        assert len(calls) == 1
+    
+    def test_get_or_compute_releases_key_lock_when_factory_raises(self):
+        """Test that a failing factory leaves no per-key lock behind."""
+        cache = CacheManager()
+        
+        def factory():
+            raise RuntimeError("compute failed")
+        
+        with pytest.raises(RuntimeError):
+            cache.get_or_compute("key", factory)
+        
+        assert cache._key_locks == {}
+        assert cache.get("key") is None
+
+    
+    def test_cache_manager_evicts_least_recently_used(self):
+        """Test that CacheManager stays within maxsize and evicts the oldest unused key."""
+        cache = CacheManager(maxsize=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        assert cache.get("a") == 1  # "a" is now the most recently used
+        cache.set("c", 3)
+        
+        assert cache.size() == 2
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.get("c") == 3
 
 
 if __name__ == "__main__":
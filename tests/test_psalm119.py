@@ -0,0 +1,53 @@
+"""
+Unit tests for the Psalm 119 helpers in bible_format.
+
+Psalm 119 is read in 24-verse portions on fixed days of the M'Cheyne plan.
+"""
+
+from datetime import date
+
+from src.bible_format import (
+    is_in_todays_psalm_119_range,
+    psalm119_active_verses,
+    render_psalm_119,
+)
+
+
+class TestPsalm119Schedule:
+    """Test suite for the daily Psalm 119 verse ranges."""
+
+    def test_day_outside_plan_has_no_verses(self):
+        """Dates without a Psalm 119 reading return an empty set rather than raising."""
+        assert psalm119_active_verses(0, date(2024, 1, 1)) == frozenset()
+        assert not is_in_todays_psalm_119_range(1, 0, date(2024, 1, 1))
+
+    def test_day_in_plan_has_its_portion(self):
+        """A scheduled day covers exactly its 24-verse portion."""
+        assert is_in_todays_psalm_119_range(1, 0, date(2024, 6, 22))
+        assert is_in_todays_psalm_119_range(24, 0, date(2024, 6, 22))
+        assert not is_in_todays_psalm_119_range(25, 0, date(2024, 6, 22))
+
+    def test_day_offset_is_applied(self):
+        """The offset selects the neighbouring day's portion."""
+        assert psalm119_active_verses(1, date(2024, 6, 21)) == frozenset(range(1, 25))
+        assert psalm119_active_verses(-1, date(2024, 6, 29)) == frozenset(range(145, 177))
+
+
+class TestPsalm119Sections:
+    """Test suite for the Hebrew letter headers on each 8-verse section."""
+
+    def test_section_headers_follow_the_alphabet(self):
+        """Verses 1, 9, ..., 169 open the Aleph ... Tau sections in order."""
+        june_28 = date(2024, 6, 28)
+        assert render_psalm_119("x", 145, 0, True, june_28).startswith("Qoph")
+        assert render_psalm_119("x", 153, 0, True, june_28).startswith("Resh")
+        assert render_psalm_119("x", 161, 0, True, june_28).startswith("Shin")
+        assert render_psalm_119("x", 169, 0, True, june_28).startswith("Tau")
+        assert "ת Tau" in render_psalm_119("x", 169, 0, False, june_28)
+
+    def test_only_section_starts_get_a_header(self):
+        """Verses inside a section render without a header."""
+        june_22 = date(2024, 6, 22)
+        assert render_psalm_119("x", 1, 0, True, june_22).startswith("Aleph")
+        assert render_psalm_119("x", 8, 0, True, june_22) == "x"
+        assert "chapter-separator" not in render_psalm_119("x", 16, 0, False, june_22)